@@ -5,13 +5,22 @@ Audio Synchronization
 Synchronize translated audio with original speech timing.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import logging
+import os
 import subprocess
 import tempfile
+import threading
+import wave
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from speechbridge.core.exceptions import ComponentException
 
 
@@ -23,9 +32,35 @@ class AudioSynchronizer:
     that preserves original timing, including pauses and silences.
     """
 
-    def __init__(self):
-        """Initialize audio synchronizer"""
+    # Format of synchronized audio (16-bit stereo PCM, 44.1 kHz)
+    SAMPLE_RATE = 44100
+    CHANNELS = 2
+    SAMPLE_WIDTH = 2
+    FRAME_SIZE = CHANNELS * SAMPLE_WIDTH
+
+    # One second of silence, shared by every silence write
+    _SILENCE_CHUNK = memoryview(bytes(FRAME_SIZE * SAMPLE_RATE))
+
+    # Speech onset scan: first N seconds, minimum leading silence and
+    # per-sample noise level (same as silencedetect=noise=-30dB:d=0.5)
+    ONSET_SCAN_SECONDS = 60
+    ONSET_MIN_SILENCE = 0.5
+    ONSET_THRESHOLD_DB = -30
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize audio synchronizer
+
+        Args:
+            max_workers: Maximum concurrent ffmpeg processes
+                (default: number of CPUs)
+        """
         self.logger = logging.getLogger('speechbridge.audiosync')
+        # Normalize passes are independent single-threaded ffmpeg
+        # processes, so they scale with core count
+        self.max_workers = max_workers or os.cpu_count() or 4
+        # Speech start per audio file, keyed by (path, mtime_ns, size)
+        self._speech_start_cache: Dict[tuple, float] = {}
 
     def synchronize_segments(
         self,
@@ -66,7 +101,7 @@ class AudioSynchronizer:
         # Detect actual speech start time to correct Whisper timing
         actual_speech_start = 0.0
         if original_audio_path and segments:
-            actual_speech_start = self._detect_speech_start(original_audio_path)
+            actual_speech_start = self.detect_speech_start(original_audio_path)
 
             # If first segment starts before actual speech, adjust it
             if segments[0]['start'] < actual_speech_start - 0.5:  # 500ms tolerance
@@ -79,122 +114,165 @@ class AudioSynchronizer:
 
         # Step 1: Generate TTS for each segment
         segment_files = []
-        for i, (seg, text) in enumerate(zip(segments, translated_texts)):
-            segment_audio = output_path / f"segment_{i:04d}.wav"
-            segment_audio_normalized = output_path / f"segment_norm_{i:04d}.wav"
+        normalize_jobs = []
+
+        # Synthesis is network bound; run several requests ahead of the
+        # normalize loop unless the engine can't be called concurrently
+        tts_workers = 1
+        if getattr(tts_engine, 'thread_safe', False):
+            tts_workers = getattr(tts_engine, 'batch_concurrency', 1)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool, \
+                ThreadPoolExecutor(max_workers=tts_workers) as tts_pool:
+            tts_jobs = []
+            submitted = {}  # Identical texts are synthesized once
+            for i, text in enumerate(translated_texts):
+                if not text or text.isspace():
+                    # Blank texts become silence without a TTS request
+                    tts_jobs.append(None)
+                    continue
+
+                job = submitted.get(text)
+                if job is None:
+                    job = tts_pool.submit(
+                        tts_engine.synthesize,
+                        text,
+                        str(output_path / f"segment_{i:04d}.wav"),
+                        language=target_lang
+                    )
+                    submitted[text] = job
+                tts_jobs.append(job)
 
-            try:
-                # Synthesize this segment
-                tts_result = tts_engine.synthesize(
-                    text,
-                    str(segment_audio),
-                    language=target_lang
-                )
+            for i, (seg, text) in enumerate(zip(segments, translated_texts)):
+                segment_audio_normalized = output_path / f"segment_norm_{i:04d}.wav"
 
-                original_duration = seg['end'] - seg['start']
-                tts_duration = tts_result['duration']
-
-                # Calculate speed adjustment needed
-                speed_factor = tts_duration / original_duration if original_duration > 0 else 1.0
-
-                # Always normalize and adjust to match original duration exactly
-                if abs(speed_factor - 1.0) > 0.05:  # More than 5% difference
-                    # Need to adjust speed to match timing
-                    if speed_factor > 2.0:
-                        # atempo has max limit of 2.0, need to chain filters
-                        self.logger.debug(
-                            f"Segment {i}: Large speed adjustment needed "
-                            f"({tts_duration:.2f}s -> {original_duration:.2f}s, factor: {speed_factor:.2f}x)"
-                        )
-                        # Chain multiple atempo filters
-                        atempo_filters = []
-                        remaining_factor = speed_factor
-                        while remaining_factor > 2.0:
-                            atempo_filters.append('atempo=2.0')
-                            remaining_factor /= 2.0
-                        if remaining_factor > 0.5:  # atempo min is 0.5
-                            atempo_filters.append(f'atempo={remaining_factor}')
-                        filter_string = ','.join(atempo_filters)
-                    elif speed_factor < 0.5:
-                        # atempo has min limit of 0.5, need to chain
-                        atempo_filters = []
-                        remaining_factor = speed_factor
-                        while remaining_factor < 0.5:
-                            atempo_filters.append('atempo=0.5')
-                            remaining_factor /= 0.5
-                        if remaining_factor <= 2.0:
-                            atempo_filters.append(f'atempo={remaining_factor}')
-                        filter_string = ','.join(atempo_filters)
+                try:
+                    original_duration = seg['end'] - seg['start']
+
+                    if tts_jobs[i] is None:
+                        # Nothing to speak: the slot is filled with zero
+                        # frames when the timeline is written
+                        used_file = None
+                        tts_duration = 0.0
                     else:
-                        # Single atempo filter is enough
-                        filter_string = f'atempo={speed_factor}'
-
-                    # Normalize format AND adjust speed to match original duration
-                    normalize_cmd = [
-                        'ffmpeg', '-y',
-                        '-i', str(segment_audio),
-                        '-filter:a', filter_string,
-                        '-ac', '2',  # Stereo
-                        '-ar', '44100',  # Sample rate
-                        '-c:a', 'pcm_s16le',  # PCM format
-                        str(segment_audio_normalized)
-                    ]
+                        # Wait for this segment's synthesis
+                        tts_result = tts_jobs[i].result()
+                        tts_duration = tts_result['duration']
+                        # May be shared with an earlier segment of the same text
+                        segment_audio = tts_result['audio_path']
+
+                        # Calculate speed adjustment needed
+                        speed_factor = tts_duration / original_duration if original_duration > 0 else 1.0
+
+                        # Always normalize and adjust to match original duration exactly
+                        if abs(speed_factor - 1.0) > 0.05:  # More than 5% difference
+                            # Need to adjust speed to match timing
+                            if speed_factor > 2.0:
+                                # atempo has max limit of 2.0, need to chain filters
+                                self.logger.debug(
+                                    f"Segment {i}: Large speed adjustment needed "
+                                    f"({tts_duration:.2f}s -> {original_duration:.2f}s, factor: {speed_factor:.2f}x)"
+                                )
+                                # Chain multiple atempo filters
+                                atempo_filters = []
+                                remaining_factor = speed_factor
+                                while remaining_factor > 2.0:
+                                    atempo_filters.append('atempo=2.0')
+                                    remaining_factor /= 2.0
+                                if remaining_factor > 0.5:  # atempo min is 0.5
+                                    atempo_filters.append(f'atempo={remaining_factor}')
+                                filter_string = ','.join(atempo_filters)
+                            elif speed_factor < 0.5:
+                                # atempo has min limit of 0.5, need to chain
+                                atempo_filters = []
+                                remaining_factor = speed_factor
+                                while remaining_factor < 0.5:
+                                    atempo_filters.append('atempo=0.5')
+                                    remaining_factor /= 0.5
+                                if remaining_factor <= 2.0:
+                                    atempo_filters.append(f'atempo={remaining_factor}')
+                                filter_string = ','.join(atempo_filters)
+                            else:
+                                # Single atempo filter is enough
+                                filter_string = f'atempo={speed_factor}'
+
+                            # Normalize format AND adjust speed to match original duration
+                            normalize_cmd = [
+                                'ffmpeg', '-y',
+                                '-i', str(segment_audio),
+                                '-filter:a', f'{filter_string},apad' if filter_string else 'apad',
+                                '-t', str(original_duration),  # Exact segment length
+                                '-ac', '2',  # Stereo
+                                '-ar', '44100',  # Sample rate
+                                '-c:a', 'pcm_s16le',  # PCM format
+                                '-threads', '1',  # Parallelism comes from the worker pool
+                                str(segment_audio_normalized)
+                            ]
+
+                            self.logger.debug(
+                                f"Segment {i}: Adjusting speed {tts_duration:.2f}s -> {original_duration:.2f}s (factor: {speed_factor:.2f}x)"
+                            )
+                        else:
+                            # Just normalize format, duration is close enough
+                            normalize_cmd = [
+                                'ffmpeg', '-y',
+                                '-i', str(segment_audio),
+                                '-filter:a', 'apad',
+                                '-t', str(original_duration),  # Exact segment length
+                                '-ac', '2',  # Stereo
+                                '-ar', '44100',  # Sample rate
+                                '-c:a', 'pcm_s16le',  # PCM format
+                                '-threads', '1',  # Parallelism comes from the worker pool
+                                str(segment_audio_normalized)
+                            ]
+
+                        # Normalize in the background while the next segment is synthesized
+                        normalize_jobs.append(pool.submit(self._run_ffmpeg, normalize_cmd))
+
+                        # Use normalized file with adjusted duration
+                        used_file = str(segment_audio_normalized)
+
+                    used_duration = original_duration  # Now matches original exactly
+
+                    segment_info = {
+                        'file': used_file,
+                        'start': seg['start'],
+                        'end': seg['end'],
+                        'original_duration': original_duration,
+                        'tts_duration': tts_duration,
+                        'used_duration': used_duration,
+                        'text': text
+                    }
+                    segment_files.append(segment_info)
 
                     self.logger.debug(
-                        f"Segment {i}: Adjusting speed {tts_duration:.2f}s -> {original_duration:.2f}s (factor: {speed_factor:.2f}x)"
+                        f"Segment {i+1}/{len(segments)}: "
+                        f"[{seg['start']:.2f}s - {seg['end']:.2f}s] "
+                        f"TTS: {tts_duration:.2f}s -> {used_duration:.2f}s"
                     )
-                else:
-                    # Just normalize format, duration is close enough
-                    normalize_cmd = [
-                        'ffmpeg', '-y',
-                        '-i', str(segment_audio),
-                        '-ac', '2',  # Stereo
-                        '-ar', '44100',  # Sample rate
-                        '-c:a', 'pcm_s16le',  # PCM format
-                        str(segment_audio_normalized)
-                    ]
-
-                subprocess.run(
-                    normalize_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=60
-                )
 
-                # Use normalized file with adjusted duration
-                used_file = str(segment_audio_normalized)
-                used_duration = original_duration  # Now matches original exactly
-
-                segment_info = {
-                    'file': used_file,
-                    'start': seg['start'],
-                    'end': seg['end'],
-                    'original_duration': original_duration,
-                    'tts_duration': tts_duration,
-                    'used_duration': used_duration,
-                    'text': text
-                }
-                segment_files.append(segment_info)
-
-                self.logger.debug(
-                    f"Segment {i+1}/{len(segments)}: "
-                    f"[{seg['start']:.2f}s - {seg['end']:.2f}s] "
-                    f"TTS: {tts_duration:.2f}s -> {used_duration:.2f}s"
-                )
-
-            except Exception as e:
-                self.logger.error(f"Failed to synthesize segment {i}: {e}")
-                raise
+                except Exception as e:
+                    self.logger.error(f"Failed to synthesize segment {i}: {e}")
+                    for job in tts_jobs:
+                        if job is not None:
+                            job.cancel()
+                    raise
+
+            # Wait for all normalize passes before building the timeline
+            for i, job in enumerate(normalize_jobs):
+                try:
+                    job.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to normalize segment {i}: {e}")
+                    raise
 
         self.logger.info(f"Generated {len(segment_files)} TTS segments")
 
         # Step 2: Create timeline with silence padding
-        timeline_file = output_path / f"timeline_{datetime.now().timestamp()}.txt"
         final_audio = output_path / f"synchronized_{datetime.now().timestamp()}.wav"
 
         self._create_synchronized_audio(
             segment_files,
-            timeline_file,
             final_audio,
             total_duration
         )
@@ -206,241 +284,296 @@ class AudioSynchronizer:
     def _create_synchronized_audio(
         self,
         segments: List[Dict[str, Any]],
-        timeline_file: Path,
         output_file: Path,
         total_duration: float
     ) -> None:
         """
-        Create synchronized audio using silence and concatenation
+        Create synchronized audio by concatenating PCM data
+
+        Segment frames and silence gaps are written straight into one
+        WAV file, so no ffmpeg process or silence files are needed.
 
         Args:
             segments: List of segment info dicts
-            timeline_file: Path to timeline file
             output_file: Path to output audio
             total_duration: Total duration in seconds
         """
-        # Strategy: Create concat demuxer file with silence padding
-        # This ensures segments don't overlap
+        # Check all segment files with one directory scan instead of
+        # failing on the first missing one halfway through the output
+        with os.scandir(output_file.parent) as it:
+            present = {entry.path for entry in it}
+        missing = [
+            seg['file'] for seg in segments
+            if seg['file'] and seg['file'] not in present
+            and not os.path.isfile(seg['file'])  # Files outside the output dir
+        ]
+        if missing:
+            raise ComponentException(
+                f"{len(missing)} segment audio file(s) missing, normalization failed",
+                {'missing': missing[:10]}
+            )
 
-        concat_file = timeline_file
-        concat_entries = []
+        rate = self.SAMPLE_RATE
+        written = 0  # Frames written so far
 
-        current_time = 0.0
-        temp_files = []
+        try:
+            with wave.open(str(output_file), 'wb') as out:
+                out.setnchannels(self.CHANNELS)
+                out.setsampwidth(self.SAMPLE_WIDTH)
+                out.setframerate(rate)
+
+                for seg in segments:
+                    # Timeline positions in frames, so rounding never accumulates
+                    start_frame = int(round(seg['start'] * rate))
+                    end_frame = int(round(seg['end'] * rate))
+
+                    # Add silence if needed before this segment
+                    if start_frame > written:
+                        self._write_zeros(out, start_frame - written)
+                        written = start_frame
+
+                    # Trim or zero-pad the segment to end exactly at its
+                    # original end time (from Whisper timing); segments
+                    # without a file are silent
+                    slot = end_frame - written
+                    if slot > 0:
+                        copied = self._append_wav(out, seg['file'], slot) if seg['file'] else 0
+                        self._write_zeros(out, slot - copied)
+                        written = end_frame
+
+                # Pad to reach total_duration
+                final_frames = int(round(total_duration * rate)) - written
+                if final_frames > 0:
+                    self._write_zeros(out, final_frames)
+
+                    self.logger.info(
+                        f"Added final silence: {final_frames / rate:.3f}s "
+                        f"to reach total duration {total_duration:.3f}s"
+                    )
 
-        for i, seg in enumerate(segments):
-            # Add silence if needed before this segment
-            if seg['start'] > current_time:
-                silence_duration = seg['start'] - current_time
-                silence_file = output_file.parent / f"silence_{i:04d}.wav"
-
-                # Create silence using ffmpeg
-                silence_cmd = [
-                    'ffmpeg', '-y',
-                    '-f', 'lavfi',
-                    '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100',
-                    '-t', str(silence_duration),
-                    '-c:a', 'pcm_s16le',
-                    str(silence_file)
-                ]
-
-                subprocess.run(
-                    silence_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=60
+        except (wave.Error, EOFError, OSError) as e:
+            raise ComponentException(
+                f"Audio synchronization failed: {e}",
+                {'output': str(output_file)}
+            )
+
+        self.logger.info("Audio synchronization complete")
+
+    def _append_wav(self, out: wave.Wave_write, path: str, max_frames: int) -> int:
+        """
+        Copy PCM frames of a WAV file into the output
+
+        Args:
+            out: Open output WAV writer
+            path: Source WAV file in the synchronized audio format
+            max_frames: Maximum number of frames to copy
+
+        Returns:
+            int: Number of frames copied
+        """
+        with wave.open(path, 'rb') as src:
+            params = (src.getnchannels(), src.getsampwidth(), src.getframerate())
+            if params != (self.CHANNELS, self.SAMPLE_WIDTH, self.SAMPLE_RATE):
+                raise ComponentException(
+                    "Segment audio format doesn't match synchronized audio",
+                    {'file': path, 'channels': params[0],
+                     'sample_width': params[1], 'sample_rate': params[2]}
                 )
 
-                concat_entries.append(f"file '{Path(silence_file).absolute()}'")
-                temp_files.append(silence_file)
-                current_time = seg['start']
+            copied = 0
+            while copied < max_frames:
+                data = src.readframes(min(self.SAMPLE_RATE, max_frames - copied))
+                if not data:
+                    break
+                out.writeframesraw(data)
+                copied += len(data) // self.FRAME_SIZE
 
-            # Add the actual segment with EXACT duration control
-            exact_duration = seg['end'] - seg['start']
+        return copied
 
-            # Create segment file with exact duration
-            exact_file = output_file.parent / f"exact_{i:04d}.wav"
+    def _write_zeros(self, out: wave.Wave_write, frame_count: int) -> None:
+        """
+        Write silent frames into an open WAV writer
 
-            # Strategy:
-            # 1. First trim segment to MAXIMUM exact_duration using -t flag (this ACTUALLY works)
-            # 2. Check actual duration with ffprobe
-            # 3. If shorter, pad to exact_duration with silence
+        Args:
+            out: Open output WAV writer
+            frame_count: Number of frames to write
+        """
+        chunk = self._SILENCE_CHUNK
 
-            # Step 1: Trim to max duration (will cut if longer, pass through if shorter)
-            trimmed_file = output_file.parent / f"trimmed_{i:04d}.wav"
+        full_chunks, remainder = divmod(frame_count, self.SAMPLE_RATE)
+        for _ in range(full_chunks):
+            out.writeframesraw(chunk)
+        out.writeframesraw(chunk[:remainder * self.FRAME_SIZE])
 
-            trim_cmd = [
-                'ffmpeg', '-y',
-                '-i', str(seg['file']),
-                '-t', str(exact_duration),  # Hard limit - cuts at this duration
-                '-c:a', 'pcm_s16le',
-                str(trimmed_file)
-            ]
+    def _run_ffmpeg(self, cmd: List[str]) -> None:
+        """
+        Run an ffmpeg command with output captured
 
-            subprocess.run(
-                trim_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=60
-            )
+        Args:
+            cmd: Command line
+        """
+        subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=60
+        )
 
-            # Step 2: Get actual duration
-            probe_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                str(trimmed_file)
-            ]
+    def detect_speech_start(self, audio_path: str) -> float:
+        """
+        Detect when speech actually starts in the audio
 
-            probe_result = subprocess.run(
-                probe_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=30
-            )
+        Results are cached per unchanged file, so the pipeline and
+        synchronize_segments() scan the audio only once.
 
-            actual_duration = float(probe_result.stdout.strip())
-
-            # Step 3: Pad if needed
-            if actual_duration < exact_duration - 0.001:  # 1ms tolerance
-                padding_needed = exact_duration - actual_duration
-
-                # Create padding silence
-                padding_file = output_file.parent / f"padding_{i:04d}.wav"
-
-                pad_cmd = [
-                    'ffmpeg', '-y',
-                    '-f', 'lavfi',
-                    '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100',
-                    '-t', str(padding_needed),
-                    '-c:a', 'pcm_s16le',
-                    str(padding_file)
-                ]
-
-                subprocess.run(
-                    pad_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=60
-                )
+        Args:
+            audio_path: Path to audio file
 
-                # Concatenate trimmed + padding
-                concat_list_file = output_file.parent / f"concat_{i:04d}.txt"
-                concat_list_file.write_text(
-                    f"file '{trimmed_file.absolute()}'\n"
-                    f"file '{padding_file.absolute()}'"
-                )
+        Returns:
+            float: Time in seconds when speech starts
+        """
+        try:
+            st = os.stat(audio_path)
+            cache_key = (audio_path, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            self.logger.warning(f"Audio not found for speech detection: {audio_path}")
+            return 0.0
+        except OSError:
+            cache_key = None
 
-                concat_cmd = [
-                    'ffmpeg', '-y',
-                    '-f', 'concat',
-                    '-safe', '0',
-                    '-i', str(concat_list_file),
-                    '-c:a', 'pcm_s16le',
-                    str(exact_file)
-                ]
-
-                subprocess.run(
-                    concat_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=60
-                )
+        if cache_key in self._speech_start_cache:
+            return self._speech_start_cache[cache_key]
 
-                temp_files.extend([trimmed_file, padding_file, concat_list_file])
-            else:
-                # Duration is already exact (or close enough), just use trimmed file
-                exact_file = trimmed_file
-
-            concat_entries.append(f"file '{Path(exact_file).absolute()}'")
-            temp_files.append(exact_file)
-
-            # Update current_time to END of this segment (from original timing)
-            # This ensures we track the timeline according to Whisper segments
-            current_time = seg['end']
-
-        # Calculate exact final silence needed to reach total_duration
-        # current_time should be at the end of the last segment
-        final_silence_needed = total_duration - current_time
-
-        if final_silence_needed > 0.001:  # Add silence if needed (tolerance 1ms)
-            final_silence_file = output_file.parent / "silence_final.wav"
-
-            # Create exact silence duration using sample count for precision
-            # 44100 samples/sec * duration = exact sample count
-            sample_count = int(final_silence_needed * 44100)
-
-            # Generate silence with exact sample count
-            silence_cmd = [
-                'ffmpeg', '-y',
-                '-f', 'lavfi',
-                '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100',
-                '-t', str(final_silence_needed),
-                '-c:a', 'pcm_s16le',
-                str(final_silence_file)
-            ]
+        speech_start = self._scan_speech_start(audio_path)
+        if cache_key is not None:
+            self._speech_start_cache[cache_key] = speech_start
+        return speech_start
 
-            subprocess.run(
-                silence_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=60
-            )
+    def _scan_speech_start(self, audio_path: str) -> float:
+        """
+        Find the speech onset, preferring an in-memory sample scan
 
-            concat_entries.append(f"file '{Path(final_silence_file).absolute()}'")
-            temp_files.append(final_silence_file)
+        Args:
+            audio_path: Path to audio file
 
-            self.logger.info(
-                f"Added final silence: {final_silence_needed:.3f}s "
-                f"to reach total duration {total_duration:.3f}s"
-            )
+        Returns:
+            float: Time in seconds when speech starts
+        """
+        if np is None:
+            return self._silencedetect_speech_start(audio_path)
+
+        preamble = self._read_pcm_preamble(audio_path)
+        if preamble is None:
+            preamble = self._decode_pcm_preamble(audio_path)
+        if preamble is None:
+            return self._silencedetect_speech_start(audio_path)
+
+        samples, rate = preamble
+        speech_start = self._find_speech_onset(samples, rate)
+        self.logger.debug(f"Detected speech start at {speech_start:.2f}s")
+        return speech_start
 
-        # Write concat file
-        concat_file.write_text('\n'.join(concat_entries))
+    def _read_pcm_preamble(self, audio_path: str) -> Optional[tuple]:
+        """
+        Read the first ONSET_SCAN_SECONDS of a 16-bit PCM WAV
+
+        Args:
+            audio_path: Path to audio file
 
-        # Build ffmpeg command using concat demuxer
+        Returns:
+            Optional[tuple]: (per-frame peak amplitudes, sample rate), or
+            None if the file is not 16-bit PCM WAV
+        """
+        try:
+            with wave.open(audio_path, 'rb') as wav:
+                if wav.getsampwidth() != 2:
+                    return None
+                rate = wav.getframerate()
+                channels = wav.getnchannels()
+                data = wav.readframes(int(self.ONSET_SCAN_SECONDS * rate))
+        except (wave.Error, EOFError, OSError):
+            return None
+
+        samples = np.frombuffer(data, dtype=np.int16).astype(np.int32)
+        samples = np.abs(samples[:len(samples) - len(samples) % channels])
+        if channels > 1:
+            # Loudest channel per frame, speech may be on one side only
+            samples = samples.reshape(-1, channels).max(axis=1)
+        return samples, rate
+
+    def _decode_pcm_preamble(self, audio_path: str) -> Optional[tuple]:
+        """
+        Decode the first ONSET_SCAN_SECONDS of any media file through an
+        ffmpeg pipe as 16 kHz mono samples, without a temp file
+
+        Args:
+            audio_path: Path to audio or video file
+
+        Returns:
+            Optional[tuple]: (per-frame peak amplitudes, sample rate), or
+            None on failure
+        """
+        rate = 16000
         cmd = [
-            'ffmpeg', '-y',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', str(concat_file),
-            '-ac', '2',  # Stereo
-            '-ar', '44100',  # Sample rate
-            str(output_file)
+            'ffmpeg', '-v', 'error',
+            '-i', audio_path,
+            '-t', str(self.ONSET_SCAN_SECONDS),
+            '-ac', '1',
+            '-ar', str(rate),
+            '-f', 's16le',
+            '-'
         ]
 
-        self.logger.debug(f"Running ffmpeg with {len(segments)} inputs")
-
         try:
             result = subprocess.run(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                timeout=300  # 5 minutes timeout
+                bufsize=1 << 20,
+                timeout=60
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.logger.debug(f"PCM decode failed for {audio_path}: {e}")
+            return None
+
+        if result.returncode != 0:
+            self.logger.debug(
+                f"PCM decode failed for {audio_path}: "
+                f"{result.stderr.decode(errors='replace').strip()}"
             )
+            return None
 
-            if result.returncode != 0:
-                self.logger.error(f"ffmpeg error: {result.stderr}")
-                raise ComponentException(
-                    "Failed to create synchronized audio",
-                    {'error': result.stderr[:200]}
-                )
+        data = result.stdout
+        samples = np.frombuffer(data[:len(data) - len(data) % 2], dtype=np.int16)
+        return np.abs(samples.astype(np.int32)), rate
 
-            self.logger.info("Audio synchronization complete")
+    def _find_speech_onset(self, peaks: Any, rate: int) -> float:
+        """
+        Locate the first sample above the noise level in one vectorized pass
 
-        except subprocess.TimeoutExpired:
-            raise ComponentException("Audio synchronization timed out")
-        except Exception as e:
-            raise ComponentException(
-                f"Audio synchronization failed: {e}"
-            )
+        Mirrors silencedetect: any sample louder than ONSET_THRESHOLD_DB
+        ends the silence, and leading silence shorter than
+        ONSET_MIN_SILENCE is ignored.
+
+        Args:
+            peaks: Per-frame absolute sample amplitudes (int16 scale)
+            rate: Sample rate in Hz
 
-    def _detect_speech_start(self, audio_path: str) -> float:
+        Returns:
+            float: Time in seconds when speech starts
         """
-        Detect when speech actually starts in the audio
+        threshold = 32768.0 * 10 ** (self.ONSET_THRESHOLD_DB / 20)
+        loud = np.flatnonzero(peaks > threshold)
+        if len(loud) == 0:
+            # No speech in the scanned preamble, keep original timing
+            return 0.0
+
+        speech_start = float(loud[0]) / rate
+        return speech_start if speech_start >= self.ONSET_MIN_SILENCE else 0.0
+
+    def _silencedetect_speech_start(self, audio_path: str) -> float:
+        """
+        Run silence detection on the audio file
 
         Args:
             audio_path: Path to audio file
@@ -452,28 +585,38 @@ class AudioSynchronizer:
             # Use ffmpeg silencedetect to find when silence ends
             cmd = [
                 'ffmpeg',
+                '-nostats',
                 '-i', audio_path,
                 '-af', 'silencedetect=noise=-30dB:d=0.5',
                 '-f', 'null',
                 '-'
             ]
 
-            result = subprocess.run(
+            # Stream stderr and stop ffmpeg at the first silence_end instead
+            # of decoding the whole file
+            proc = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
-                timeout=60
+                text=True
             )
+            watchdog = threading.Timer(60, proc.kill)
+            watchdog.start()
 
-            # Parse output for first silence_end
-            for line in result.stderr.split('\n'):
-                if 'silence_end:' in line:
-                    # Extract time: "silence_end: 8.14575 | silence_duration: 8.14575"
-                    parts = line.split('silence_end:')[1].split('|')[0].strip()
-                    speech_start = float(parts)
-                    self.logger.debug(f"Detected speech start at {speech_start:.2f}s")
-                    return speech_start
+            try:
+                for line in proc.stderr:
+                    if 'silence_end:' in line:
+                        # Extract time: "silence_end: 8.14575 | silence_duration: 8.14575"
+                        parts = line.split('silence_end:')[1].split('|')[0].strip()
+                        speech_start = float(parts)
+                        self.logger.debug(f"Detected speech start at {speech_start:.2f}s")
+                        return speech_start
+            finally:
+                watchdog.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                proc.stderr.close()
+                proc.wait()
 
             # No silence detected at start, speech starts at 0
             return 0.0
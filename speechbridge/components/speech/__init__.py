@@ -6,14 +6,17 @@ Automatic Speech Recognition (ASR) components with GPU support.
 
 Available engines:
 - WhisperRecognizer: OpenAI Whisper (local, GPU-accelerated)
+- FasterWhisperRecognizer: Whisper on CTranslate2 (faster-whisper, int8)
 - GoogleRecognizer: Google Cloud Speech-to-Text
 - SphinxRecognizer: CMU Sphinx (offline)
 """
 
 from .base import BaseSpeechRecognizer
 from .whisper import WhisperRecognizer
+from .faster_whisper import FasterWhisperRecognizer
 
 __all__ = [
     'BaseSpeechRecognizer',
     'WhisperRecognizer',
+    'FasterWhisperRecognizer',
 ]
@@ -8,6 +8,7 @@ Abstract base class for all speech recognition engines.
 from abc import abstractmethod
 from typing import Dict, Any, Optional
 from pathlib import Path
+import os
 
 from speechbridge.core.base import BaseProcessor
 from speechbridge.core.types import TranscriptionResult
@@ -90,13 +91,14 @@ class BaseSpeechRecognizer(BaseProcessor):
             ComponentException: If input is invalid
         """
         if isinstance(input_data, (str, Path)):
-            audio_path = Path(input_data)
-            if not audio_path.exists():
+            audio_path = os.fspath(input_data)
+            # Single stat call; also rejects directories
+            if not os.path.isfile(audio_path):
                 raise ComponentException(
                     f"Audio file not found: {audio_path}",
-                    {'path': str(audio_path)}
+                    {'path': audio_path}
                 )
-            return str(audio_path)
+            return audio_path
 
         raise ComponentException(
             "Invalid audio input type",
@@ -0,0 +1,213 @@
+"""
+Faster-Whisper Speech Recognition
+==================================
+
+Whisper speech recognition on the CTranslate2 runtime (faster-whisper)
+with int8 quantization.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+import threading
+
+from .whisper import WhisperRecognizer
+from speechbridge.core.types import TranscriptionResult
+from speechbridge.core.exceptions import ComponentException
+
+
+class FasterWhisperRecognizer(WhisperRecognizer):
+    """
+    Whisper recognizer backed by faster-whisper (CTranslate2)
+
+    Runs the same Whisper models several times faster than openai-whisper,
+    using int8 weights on CPU and int8/float16 on CUDA.
+    """
+
+    # Loaded models shared by all instances, keyed by (model name, device, compute type)
+    _model_cache: Dict[Tuple[str, str, str], Any] = {}
+    _model_cache_lock = threading.Lock()
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize faster-whisper recognizer
+
+        Args:
+            config: Configuration with parameters:
+                - model: Model size (default: 'base')
+                - use_gpu: Use GPU if available (default: True)
+                - language: Source language (default: 'auto')
+                - task: 'transcribe' or 'translate' (default: 'transcribe')
+                - compute_type: CTranslate2 compute type
+                  (default: 'int8_float16' on CUDA, 'int8' otherwise)
+                - vad_filter: Skip silent parts with Silero VAD (default: True)
+                - beam_size: Beam size for decoding (default: 5)
+                - silence_threshold: RMS level below which audio is treated
+                  as silent and not transcribed (default: disabled)
+                - result_cache_size: Number of transcriptions kept for
+                  unchanged files (default: 0, disabled)
+                - preload: Start loading the model in a background thread
+                  right away (default: False)
+        """
+        config = config or {}
+
+        # Set before super().__init__(), which may start a background preload
+        self._compute_type = config.get('compute_type')
+        self.vad_filter = config.get('vad_filter', True)
+        self.beam_size = config.get('beam_size', 5)
+
+        super().__init__(config)
+
+    @property
+    def compute_type(self) -> str:
+        """CTranslate2 compute type for the selected device"""
+        if self._compute_type:
+            return self._compute_type
+        return 'int8_float16' if self.device == 'cuda' else 'int8'
+
+    def _get_device(self) -> str:
+        """CTranslate2 supports CUDA and CPU only"""
+        device = super()._get_device()
+        return 'cpu' if device == 'mps' else device
+
+    def initialize(self) -> None:
+        """
+        Initialize faster-whisper model
+
+        Loads the CTranslate2 model onto the selected device
+        """
+        if self._initialized:
+            return
+
+        try:
+            from faster_whisper import WhisperModel
+
+            key = (self.model_name, self.device, self.compute_type)
+            with self._model_cache_lock:
+                model = self._model_cache.get(key)
+                if model is None:
+                    self.logger.info(
+                        f"Loading faster-whisper model '{self.model_name}' "
+                        f"on {self.device} ({self.compute_type})"
+                    )
+                    model = WhisperModel(
+                        self.model_name,
+                        device=self.device,
+                        compute_type=self.compute_type
+                    )
+                    self._model_cache[key] = model
+
+            self.model = model
+            self._initialized = True
+            self.logger.info(f"faster-whisper model ready on {self.device}")
+
+        except ImportError:
+            raise ComponentException(
+                "faster-whisper library not installed",
+                {'solution': 'pip install faster-whisper'}
+            )
+        except Exception as e:
+            raise ComponentException(
+                f"Failed to load faster-whisper model: {e}",
+                {'model': self.model_name, 'device': self.device}
+            )
+
+    def _decoding_options(self) -> tuple:
+        """
+        Settings that affect the transcription output
+
+        Returns:
+            tuple: Hashable option values
+        """
+        return (
+            self.model_name, self.task, self.language, self.compute_type,
+            self.vad_filter, self.beam_size, self.silence_threshold
+        )
+
+    def _load_audio(self, audio_path: str) -> Any:
+        """
+        Decode audio file to a 16 kHz mono waveform
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            np.ndarray: Decoded waveform
+        """
+        from faster_whisper import decode_audio
+        return decode_audio(audio_path)
+
+    def _transcribe_input(self, audio: Any, audio_path: str) -> TranscriptionResult:
+        """
+        Run faster-whisper on a file path or decoded waveform
+
+        Args:
+            audio: Audio file path or decoded waveform
+            audio_path: Source file path (for logging and errors)
+
+        Returns:
+            TranscriptionResult: Transcription with segments and metadata
+        """
+        try:
+            self.logger.info(f"Transcribing: {audio_path}")
+
+            segments_iter, info = self.model.transcribe(
+                audio,
+                task=self.task,
+                language=None if self.language == 'auto' else self.language,
+                beam_size=self.beam_size,
+                vad_filter=self.vad_filter
+            )
+
+            # Segments are produced lazily while iterating
+            segments = [
+                {
+                    'id': seg.id,
+                    'start': seg.start,
+                    'end': seg.end,
+                    'text': seg.text,
+                    'avg_logprob': seg.avg_logprob,
+                    'no_speech_prob': seg.no_speech_prob
+                }
+                for seg in segments_iter
+            ]
+            result = {
+                'text': ''.join(seg['text'] for seg in segments),
+                'segments': segments
+            }
+
+            transcription: TranscriptionResult = {
+                'text': result['text'].strip(),
+                'language': info.language or self.language,
+                'confidence': self._calculate_confidence(result),
+                'segments': segments,
+                'duration': info.duration
+            }
+
+            self.logger.info(
+                f"Transcription complete: {len(transcription['text'])} chars"
+            )
+
+            return transcription
+
+        except Exception as e:
+            raise ComponentException(
+                f"faster-whisper transcription failed: {e}",
+                {'audio': audio_path, 'model': self.model_name}
+            )
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get faster-whisper recognizer information
+
+        Returns:
+            Dict: Complete info including model details
+        """
+        info = super().get_info()
+        # openai-whisper specific settings don't apply here
+        info.pop('fp16', None)
+        info.pop('compiled', None)
+        info.update({
+            'backend': 'faster-whisper',
+            'compute_type': self.compute_type,
+            'vad_filter': self.vad_filter
+        })
+        return info
@@ -5,8 +5,13 @@ Whisper Speech Recognition
 OpenAI Whisper-based speech recognition with GPU acceleration.
 """
 
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+import copy
+import os
+import threading
 
 from .base import BaseSpeechRecognizer
 from speechbridge.core.types import TranscriptionResult
@@ -35,6 +40,17 @@ class WhisperRecognizer(BaseSpeechRecognizer):
         'ha', 'ba', 'jw', 'su'
     ]
 
+    # Sample rate of decoded audio (whisper.audio.SAMPLE_RATE)
+    SAMPLE_RATE = 16000
+
+    # Loaded models shared by all instances, keyed by (model name, device, compiled)
+    _model_cache: Dict[Tuple[str, str, bool], Any] = {}
+    _model_cache_lock = threading.Lock()
+
+    # One lock per shared model: transcribe() installs KV-cache hooks on the
+    # decoder, so concurrent calls on the same model would corrupt each other
+    _model_locks: Dict[Tuple[str, str, bool], threading.Lock] = {}
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize Whisper recognizer
@@ -45,12 +61,27 @@ class WhisperRecognizer(BaseSpeechRecognizer):
                 - use_gpu: Use GPU if available (default: True)
                 - language: Source language (default: 'auto')
                 - task: 'transcribe' or 'translate' (default: 'transcribe')
+                - fp16: Half-precision inference (default: True on CUDA only)
+                - silence_threshold: RMS level (0.0-1.0) below which audio is
+                  treated as silent and not transcribed (default: disabled)
+                - result_cache_size: Number of transcriptions kept for
+                  unchanged files (default: 0, disabled)
+                - compile: Compile the decoder with torch.compile (default: False)
+                - compile_cache_dir: Persistent inductor cache directory (optional)
+                - preload: Start loading the model in a background thread
+                  right away (default: False)
         """
         super().__init__(config)
 
         self.model_name = self.config.get('model', 'base')
         self.task = self.config.get('task', 'transcribe')
+        self.fp16 = self.config.get('fp16')
+        self.silence_threshold = self.config.get('silence_threshold')
+        self.result_cache_size = self.config.get('result_cache_size', 0)
+        self._result_cache: OrderedDict = OrderedDict()
+        self.compile = self.config.get('compile', False)
         self.model = None
+        self._model_lock = threading.Lock()
 
         # Validate model name
         if self.model_name not in self.SUPPORTED_MODELS:
@@ -59,6 +90,42 @@ class WhisperRecognizer(BaseSpeechRecognizer):
             )
             self.model_name = 'base'
 
+        self._preload_done: Optional[threading.Event] = None
+        if self.config.get('preload', False):
+            self.preload()
+
+    def preload(self) -> None:
+        """
+        Start loading the model in a background thread
+
+        Model loading takes seconds; starting it early lets it overlap with
+        audio extraction. transcribe() waits for the load to finish.
+        """
+        if self._initialized or self._preload_done is not None:
+            return
+
+        self._preload_done = threading.Event()
+        threading.Thread(
+            target=self._preload_model,
+            name=f"{self.__class__.__name__}-preload",
+            daemon=True
+        ).start()
+
+    def _preload_model(self) -> None:
+        """Background preload target"""
+        try:
+            self.initialize()
+        except ComponentException as e:
+            # transcribe() retries initialize() and reports the error
+            self.logger.warning(f"Background model preload failed: {e}")
+        finally:
+            self._preload_done.set()
+
+    def _wait_for_preload(self) -> None:
+        """Block until a background preload (if any) has finished"""
+        if self._preload_done is not None:
+            self._preload_done.wait()
+
     def initialize(self) -> None:
         """
         Initialize Whisper model
@@ -77,10 +144,7 @@ class WhisperRecognizer(BaseSpeechRecognizer):
 
             # Try loading on specified device
             try:
-                self.model = whisper.load_model(
-                    self.model_name,
-                    device=self.device
-                )
+                self.model = self._load_model(whisper, self.device)
                 self._initialized = True
                 self.logger.info(f"Whisper model loaded successfully on {self.device}")
 
@@ -90,10 +154,7 @@ class WhisperRecognizer(BaseSpeechRecognizer):
                     self.logger.warning(f"MPS failed: {str(device_error)[:100]}...")
                     self.logger.info("Falling back to CPU for Whisper")
                     self.device = 'cpu'
-                    self.model = whisper.load_model(
-                        self.model_name,
-                        device='cpu'
-                    )
+                    self.model = self._load_model(whisper, 'cpu')
                     self._initialized = True
                     self.logger.info("Whisper model loaded successfully on CPU")
                 else:
@@ -110,6 +171,80 @@ class WhisperRecognizer(BaseSpeechRecognizer):
                 {'model': self.model_name, 'device': self.device}
             )
 
+    def _load_model(self, whisper, device: str) -> Any:
+        """
+        Load Whisper model or reuse an already loaded one
+
+        Args:
+            whisper: Imported whisper module
+            device: Target device
+
+        Returns:
+            whisper.Whisper: Loaded model
+        """
+        key = (self.model_name, device, bool(self.compile))
+        with self._model_cache_lock:
+            model = self._model_cache.get(key)
+            if model is None:
+                # in_memory=True reads the checkpoint in one pass and
+                # deserializes it from memory
+                model = whisper.load_model(
+                    self.model_name,
+                    device=device,
+                    in_memory=True
+                )
+                if self.compile:
+                    self._compile_decoder(model)
+                self._model_cache[key] = model
+                self._model_locks[key] = threading.Lock()
+            else:
+                self.logger.debug(f"Reusing cached Whisper model '{self.model_name}' on {device}")
+            self._model_lock = self._model_locks[key]
+        return model
+
+    def _compile_decoder(self, model: Any) -> None:
+        """
+        Compile the model decoder with torch.compile
+
+        Decoding runs the decoder once per token, so it gains the most from
+        compilation. Compiled graphs are kept in the inductor FX graph cache
+        so later processes skip most of the compile time.
+
+        Args:
+            model: Loaded Whisper model
+        """
+        try:
+            import torch
+
+            os.environ.setdefault('TORCHINDUCTOR_FX_GRAPH_CACHE', '1')
+            cache_dir = self.config.get('compile_cache_dir')
+            if cache_dir:
+                os.environ.setdefault('TORCHINDUCTOR_CACHE_DIR', str(cache_dir))
+
+            model.decoder = torch.compile(
+                model.decoder,
+                mode='reduce-overhead',
+                fullgraph=False,
+                dynamic=False
+            )
+            self.logger.info("Whisper decoder compiled with torch.compile")
+
+        except Exception as e:
+            # Compilation is an optimization only; keep the eager decoder
+            self.logger.warning(f"torch.compile unavailable, using eager decoder: {e}")
+
+    def _use_fp16(self) -> bool:
+        """
+        Decide whether to run inference in half precision
+
+        Returns:
+            bool: Configured fp16 value, or True only on CUDA by default
+        """
+        # FP16 halves decoder memory traffic on CUDA; CPU/MPS stay fp32
+        if self.fp16 is not None:
+            return bool(self.fp16)
+        return self.device == 'cuda'
+
     def transcribe(self, audio_path: str) -> TranscriptionResult:
         """
         Transcribe audio using Whisper
@@ -121,24 +256,198 @@ class WhisperRecognizer(BaseSpeechRecognizer):
             TranscriptionResult: Transcription with segments and metadata
         """
         # Ensure model is loaded
+        self._wait_for_preload()
         if not self._initialized:
             self.initialize()
 
+        cache_key = self._result_cache_key(audio_path)
+        if cache_key is not None and cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            self.logger.info(f"Using cached transcription: {audio_path}")
+            return copy.deepcopy(self._result_cache[cache_key])
+
+        transcription = self._transcribe_file(audio_path)
+
+        if cache_key is not None:
+            # Callers may adjust segment timing in place, so store a copy
+            self._result_cache[cache_key] = copy.deepcopy(transcription)
+            if len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+
+        return transcription
+
+    def _transcribe_file(self, audio_path: str) -> TranscriptionResult:
+        """
+        Transcribe an audio file without consulting the result cache
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            TranscriptionResult: Transcription with segments and metadata
+        """
+        if not self.silence_threshold:
+            return self._transcribe_input(audio_path, audio_path)
+
+        # Decode once here; the model would decode the file anyway
+        try:
+            audio = self._load_audio(audio_path)
+        except Exception as e:
+            raise ComponentException(
+                f"Failed to load audio: {e}",
+                {'audio': audio_path}
+            )
+        return self._transcribe_decoded(audio, audio_path)
+
+    def transcribe_batch(self, audio_paths: List[str]) -> List[TranscriptionResult]:
+        """
+        Transcribe multiple audio files
+
+        Decoding of the next file runs in a background thread while the
+        current one is transcribed, so ffmpeg decoding overlaps inference.
+
+        Args:
+            audio_paths: Paths to audio files
+
+        Returns:
+            List[TranscriptionResult]: Results in input order
+        """
+        self._wait_for_preload()
+        if not self._initialized:
+            self.initialize()
+
+        results = []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(self._load_audio, audio_paths[0]) if audio_paths else None
+
+            for i, audio_path in enumerate(audio_paths):
+                try:
+                    audio = pending.result()
+                except Exception as e:
+                    raise ComponentException(
+                        f"Failed to load audio: {e}",
+                        {'audio': audio_path}
+                    )
+
+                if i + 1 < len(audio_paths):
+                    pending = pool.submit(self._load_audio, audio_paths[i + 1])
+
+                results.append(self._transcribe_decoded(audio, audio_path))
+
+        return results
+
+    def _result_cache_key(self, audio_path: str) -> Optional[tuple]:
+        """
+        Build the result cache key for an audio file
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            tuple: Key from file identity and decoding options, or None
+                if caching is disabled or the file can't be stat'ed
+        """
+        if self.result_cache_size <= 0:
+            return None
+        try:
+            st = os.stat(audio_path)
+        except OSError:
+            return None
+        return (
+            os.path.abspath(audio_path), st.st_mtime_ns, st.st_size,
+            self._decoding_options()
+        )
+
+    def _decoding_options(self) -> tuple:
+        """
+        Settings that affect the transcription output
+
+        Returns:
+            tuple: Hashable option values
+        """
+        return (self.model_name, self.task, self.language, self._use_fp16(), self.silence_threshold)
+
+    def _transcribe_decoded(self, audio: Any, audio_path: str) -> TranscriptionResult:
+        """
+        Transcribe a decoded waveform, skipping the model for silent audio
+
+        Args:
+            audio: Decoded waveform
+            audio_path: Source file path (for logging and errors)
+
+        Returns:
+            TranscriptionResult: Transcription with segments and metadata
+        """
+        if self.silence_threshold and self._is_silent(audio):
+            self.logger.info(f"Audio is silent, skipping transcription: {audio_path}")
+            return {
+                'text': '',
+                'language': self.language,
+                'confidence': 1.0,
+                'segments': [],
+                'duration': len(audio) / self.SAMPLE_RATE
+            }
+
+        return self._transcribe_input(audio, audio_path)
+
+    def _is_silent(self, audio: Any) -> bool:
+        """
+        Check whether the waveform RMS is below the silence threshold
+
+        Args:
+            audio: Decoded float32 waveform in [-1, 1]
+
+        Returns:
+            bool: True if the audio contains no signal above the threshold
+        """
+        import numpy as np
+
+        if len(audio) == 0:
+            return True
+        rms = float(np.sqrt(np.mean(np.square(audio, dtype=np.float64))))
+        return rms < self.silence_threshold
+
+    def _load_audio(self, audio_path: str) -> Any:
+        """
+        Decode audio file to a 16 kHz mono waveform
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            np.ndarray: Decoded waveform
+        """
+        import whisper
+        return whisper.load_audio(audio_path)
+
+    def _transcribe_input(self, audio: Any, audio_path: str) -> TranscriptionResult:
+        """
+        Run Whisper on a file path or decoded waveform
+
+        Args:
+            audio: Audio file path or decoded waveform
+            audio_path: Source file path (for logging and errors)
+
+        Returns:
+            TranscriptionResult: Transcription with segments and metadata
+        """
         try:
             self.logger.info(f"Transcribing: {audio_path}")
 
             # Prepare transcription options
             options = {
                 'task': self.task,
-                'verbose': False
+                'verbose': False,
+                'fp16': self._use_fp16()
             }
 
             # Set language if not auto-detect
             if self.language != 'auto':
                 options['language'] = self.language
 
-            # Perform transcription
-            result = self.model.transcribe(audio_path, **options)
+            # Perform transcription (one call at a time per shared model)
+            with self._model_lock:
+                result = self.model.transcribe(audio, **options)
 
             # Extract text and metadata
             transcription: TranscriptionResult = {
@@ -249,6 +558,8 @@ class WhisperRecognizer(BaseSpeechRecognizer):
         info.update({
             'model': self.model_name,
             'task': self.task,
+            'fp16': self._use_fp16(),
+            'compiled': bool(self.compile),
             'num_supported_languages': len(self.SUPPORTED_LANGUAGES)
         })
         return info
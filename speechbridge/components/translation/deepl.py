@@ -7,6 +7,7 @@ Professional-quality translation using DeepL API.
 
 from typing import Dict, Any, List, Optional
 import os
+import threading
 
 from .base import BaseTranslator
 from speechbridge.core.types import TranslationResult
@@ -36,6 +37,11 @@ class DeepLTranslator(BaseTranslator):
         'uk', 'zh'
     ]
 
+    # deepl.Translator clients shared by all instances, keyed by API key,
+    # so pipelines reuse one HTTP session (and its TLS connections)
+    _clients: Dict[str, Any] = {}
+    _clients_lock = threading.Lock()
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize DeepL translator
@@ -74,8 +80,12 @@ class DeepLTranslator(BaseTranslator):
 
             self.logger.info("Initializing DeepL translator")
 
-            # Create translator instance
-            self.translator = deepl.Translator(self.api_key)
+            # Create translator instance (or reuse the one for this key)
+            with self._clients_lock:
+                self.translator = self._clients.get(self.api_key)
+                if self.translator is None:
+                    self.translator = deepl.Translator(self.api_key)
+                    self._clients[self.api_key] = self.translator
 
             # Test API key by getting usage
             usage = self.translator.get_usage()
@@ -5,6 +5,7 @@ Base Text-to-Speech Component
 Abstract base class for all TTS engines.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from abc import abstractmethod
 from pathlib import Path
@@ -21,6 +22,10 @@ class BaseTTS(BaseProcessor):
     and provide voice information.
     """
 
+    # Whether synthesize() may run concurrently from several threads;
+    # engines opt in after making sure their synthesize() is reentrant
+    thread_safe = False
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize TTS engine
@@ -32,6 +37,8 @@ class BaseTTS(BaseProcessor):
                 - rate: Speech rate multiplier (default: 1.0)
                 - pitch: Pitch adjustment (default: 0)
                 - volume: Volume level 0-100 (default: 100)
+                - batch_concurrency: Maximum concurrent syntheses in
+                  batch mode (default: 3)
                 - use_gpu: Use GPU if available (default: True)
         """
         super().__init__(config)
@@ -41,6 +48,7 @@ class BaseTTS(BaseProcessor):
         self.rate = self.config.get('rate', 1.0)
         self.pitch = self.config.get('pitch', 0)
         self.volume = self.config.get('volume', 100)
+        self.batch_concurrency = max(1, self.config.get('batch_concurrency', 3))
 
     @abstractmethod
     def initialize(self) -> None:
@@ -83,8 +91,9 @@ class BaseTTS(BaseProcessor):
         """
         Synthesize multiple texts
 
-        Default implementation synthesizes one by one.
-        Override for batch optimization.
+        Default implementation runs up to batch_concurrency syntheses
+        in a thread pool (one by one for engines that are not thread
+        safe). Override for batch optimization.
 
         Args:
             texts: List of texts to synthesize
@@ -98,13 +107,21 @@ class BaseTTS(BaseProcessor):
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True, parents=True)
 
-        results = []
-        for i, text in enumerate(texts):
-            file_path = output_path / f"speech_{i:04d}.wav"
-            result = self.synthesize(text, str(file_path), voice, language)
-            results.append(result)
-
-        return results
+        file_paths = [str(output_path / f"speech_{i:04d}.wav") for i in range(len(texts))]
+
+        if not self.thread_safe or self.batch_concurrency == 1 or len(texts) < 2:
+            return [
+                self.synthesize(text, path, voice, language)
+                for text, path in zip(texts, file_paths)
+            ]
+
+        with ThreadPoolExecutor(max_workers=self.batch_concurrency) as pool:
+            futures = [
+                pool.submit(self.synthesize, text, path, voice, language)
+                for text, path in zip(texts, file_paths)
+            ]
+            # Collect in submission order
+            return [future.result() for future in futures]
 
     @abstractmethod
     def get_available_voices(self, language: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -5,15 +5,78 @@ Edge TTS
 Free text-to-speech using Microsoft Edge's cloud service.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import asyncio
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import threading
+import wave
+
+try:
+    import edge_tts
+except ImportError:
+    edge_tts = None
 
 from .base import BaseTTS
 from speechbridge.core.types import TTSResult
 from speechbridge.core.exceptions import ComponentException
 
 
+# Sentence boundary: whitespace after terminal punctuation
+_SENTENCE_END = re.compile(r'(?<=[.!?…。！？])\s+')
+
+# Default voice for each language code
+_LANGUAGE_VOICES = {
+    'ru': 'ru-RU-DmitryNeural',      # Russian
+    'en': 'en-US-AriaNeural',        # English
+    'de': 'de-DE-KatjaNeural',       # German
+    'es': 'es-ES-ElviraNeural',      # Spanish
+    'fr': 'fr-FR-DeniseNeural',      # French
+    'it': 'it-IT-ElsaNeural',        # Italian
+    'pt': 'pt-BR-FranciscaNeural',   # Portuguese
+    'zh': 'zh-CN-XiaoxiaoNeural',    # Chinese
+    'ja': 'ja-JP-NanamiNeural',      # Japanese
+    'ko': 'ko-KR-SunHiNeural',       # Korean
+    'ar': 'ar-SA-ZariyahNeural',     # Arabic
+    'hi': 'hi-IN-SwaraNeural',       # Hindi
+    'pl': 'pl-PL-ZofiaNeural',       # Polish
+    'nl': 'nl-NL-ColetteNeural',     # Dutch
+    'tr': 'tr-TR-EmelNeural',        # Turkish
+    'sv': 'sv-SE-SofieNeural',       # Swedish
+    'cs': 'cs-CZ-VlastaNeural',      # Czech
+    'uk': 'uk-UA-PolinaNeural',      # Ukrainian
+    'el': 'el-GR-AthinaNeural',      # Greek
+    'ro': 'ro-RO-AlinaNeural',       # Romanian
+    'hu': 'hu-HU-NoemiNeural',       # Hungarian
+    'da': 'da-DK-ChristelNeural',    # Danish
+    'fi': 'fi-FI-NooraNeural',       # Finnish
+    'no': 'nb-NO-PernilleNeural',    # Norwegian
+    'th': 'th-TH-PremwadeeNeural',   # Thai
+    'vi': 'vi-VN-HoaiMyNeural',      # Vietnamese
+    'id': 'id-ID-GadisNeural',       # Indonesian
+    'ms': 'ms-MY-YasminNeural',      # Malay
+}
+
+
+@lru_cache(maxsize=32)
+def _voice_for_language(language: str) -> str:
+    """
+    Resolve default voice for a language code
+
+    Args:
+        language: Language code (e.g., 'ru', 'en', 'de')
+
+    Returns:
+        str: Voice name, English voice if the language is unknown
+    """
+    return _LANGUAGE_VOICES.get(language.lower(), 'en-US-AriaNeural')
+
+
 class EdgeTTS(BaseTTS):
     """
     Microsoft Edge TTS engine
@@ -22,6 +85,9 @@ class EdgeTTS(BaseTTS):
     Supports 400+ voices in 100+ languages.
     """
 
+    # Each synthesize() call runs its own event loop and writes files atomically
+    thread_safe = True
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize Edge TTS
@@ -33,11 +99,26 @@ class EdgeTTS(BaseTTS):
                 - rate: Speech rate (default: 1.0)
                 - pitch: Pitch adjustment (default: 0)
                 - volume: Volume level (default: 100)
+                - cache_dir: Directory for cached synthesis results
+                  (default: None, caching disabled)
+                - cache_max_bytes: Cache size limit, least recently used
+                  files are evicted first (default: 512 MB)
+                - split_threshold: Texts longer than this many characters
+                  are synthesized sentence by sentence in parallel
+                  (default: 300, 0 disables)
         """
         super().__init__(config)
 
         self._voices_cache = None
 
+        cache_dir = self.config.get('cache_dir')
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_max_bytes = self.config.get('cache_max_bytes', 512 * 1024 * 1024)
+        if self.cache_dir:
+            self.cache_dir.mkdir(exist_ok=True, parents=True)
+
+        self.split_threshold = self.config.get('split_threshold', 300)
+
     def _get_default_voice(self) -> str:
         """
         Get default voice for Edge TTS
@@ -57,40 +138,8 @@ class EdgeTTS(BaseTTS):
         Returns:
             str: Voice name for the language
         """
-        # Map language codes to default voices
-        voice_map = {
-            'ru': 'ru-RU-DmitryNeural',      # Russian
-            'en': 'en-US-AriaNeural',        # English
-            'de': 'de-DE-KatjaNeural',       # German
-            'es': 'es-ES-ElviraNeural',      # Spanish
-            'fr': 'fr-FR-DeniseNeural',      # French
-            'it': 'it-IT-ElsaNeural',        # Italian
-            'pt': 'pt-BR-FranciscaNeural',   # Portuguese
-            'zh': 'zh-CN-XiaoxiaoNeural',    # Chinese
-            'ja': 'ja-JP-NanamiNeural',      # Japanese
-            'ko': 'ko-KR-SunHiNeural',       # Korean
-            'ar': 'ar-SA-ZariyahNeural',     # Arabic
-            'hi': 'hi-IN-SwaraNeural',       # Hindi
-            'pl': 'pl-PL-ZofiaNeural',       # Polish
-            'nl': 'nl-NL-ColetteNeural',     # Dutch
-            'tr': 'tr-TR-EmelNeural',        # Turkish
-            'sv': 'sv-SE-SofieNeural',       # Swedish
-            'cs': 'cs-CZ-VlastaNeural',      # Czech
-            'uk': 'uk-UA-PolinaNeural',      # Ukrainian
-            'el': 'el-GR-AthinaNeural',      # Greek
-            'ro': 'ro-RO-AlinaNeural',       # Romanian
-            'hu': 'hu-HU-NoemiNeural',       # Hungarian
-            'da': 'da-DK-ChristelNeural',    # Danish
-            'fi': 'fi-FI-NooraNeural',       # Finnish
-            'no': 'nb-NO-PernilleNeural',    # Norwegian
-            'th': 'th-TH-PremwadeeNeural',   # Thai
-            'vi': 'vi-VN-HoaiMyNeural',      # Vietnamese
-            'id': 'id-ID-GadisNeural',       # Indonesian
-            'ms': 'ms-MY-YasminNeural',      # Malay
-        }
-
         # Get voice for language, default to English if not found
-        voice = voice_map.get(language.lower(), 'en-US-AriaNeural')
+        voice = _voice_for_language(language)
         self.logger.debug(f"Selected voice {voice} for language {language}")
         return voice
 
@@ -103,18 +152,15 @@ class EdgeTTS(BaseTTS):
         if self._initialized:
             return
 
-        try:
-            import edge_tts
-
-            self.logger.info("Edge TTS initialized")
-            self._initialized = True
-
-        except ImportError:
+        if edge_tts is None:
             raise ComponentException(
                 "Edge TTS library not installed",
                 {'solution': 'pip install edge-tts'}
             )
 
+        self.logger.info("Edge TTS initialized")
+        self._initialized = True
+
     def synthesize(
         self,
         text: str,
@@ -134,6 +180,8 @@ class EdgeTTS(BaseTTS):
         Returns:
             TTSResult: Synthesis result with metadata
         """
+        self._check_text(text)
+
         # Ensure engine is initialized
         if not self._initialized:
             self.initialize()
@@ -149,8 +197,7 @@ class EdgeTTS(BaseTTS):
         try:
             self.logger.info(f"Synthesizing with {voice_name}: {len(text)} chars")
 
-            # Run async synthesis
-            asyncio.run(self._synthesize_async(text, output_path, voice_name))
+            asyncio.run(self._synthesize_to_file_async(text, output_path, voice_name))
 
             # Get audio duration
             duration = self._get_audio_duration(output_path)
@@ -174,6 +221,278 @@ class EdgeTTS(BaseTTS):
                 {'text_length': len(text), 'voice': voice_name}
             )
 
+    def _check_text(self, text: str) -> None:
+        """
+        Reject empty or whitespace-only text
+
+        Args:
+            text: Text to synthesize
+        """
+        # isspace() checks without copying the text like strip() would
+        if not text or text.isspace():
+            raise ComponentException(
+                "Cannot synthesize empty text",
+                {'text_length': len(text or '')}
+            )
+
+    async def _synthesize_to_file_async(
+        self,
+        text: str,
+        output_path: str,
+        voice: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        evict: bool = True
+    ) -> None:
+        """
+        Synthesize one text into a file, using the disk cache
+
+        Args:
+            text: Text to synthesize (already checked)
+            output_path: Output file path
+            voice: Voice name
+            semaphore: Limit on requests in flight, shared by a batch
+                (default: a new one of batch_concurrency)
+            evict: Enforce cache_max_bytes after storing (default: True)
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        cache_key = self._cache_key(text, voice) if self.cache_dir else None
+
+        if cache_key and self._load_from_cache(cache_key, output_path):
+            self.logger.info("Using cached synthesis result")
+            return
+
+        sentences = self._split_sentences(text)
+
+        if cache_key or len(sentences) > 1:
+            # Synthesize into memory so the same bytes feed the cache
+            # and the output file without reading it back
+            if len(sentences) > 1:
+                # Long text: synthesize sentences concurrently, MP3
+                # frames of the parts concatenate cleanly
+                self.logger.debug(f"Split into {len(sentences)} sentences")
+                audio = await self._synthesize_sentences_async(sentences, voice, semaphore)
+            else:
+                async with semaphore:
+                    audio = await self._stream_audio(text, voice)
+
+            self._write_atomic(Path(output_path), audio)
+
+            if cache_key:
+                self._store_in_cache(cache_key, audio, evict=evict)
+        else:
+            async with semaphore:
+                await self._synthesize_async(text, output_path, voice)
+
+    def _cache_key(self, text: str, voice: str) -> str:
+        """
+        Build cache key for a synthesis request
+
+        Args:
+            text: Text to synthesize
+            voice: Voice name
+
+        Returns:
+            str: Hex digest of text, voice and prosody settings
+        """
+        data = '\0'.join((
+            text, voice,
+            self._format_rate(self.rate),
+            self._format_pitch(self.pitch),
+            self._format_volume(self.volume)
+        ))
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        """
+        Get cache file path for a key
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path: Cached audio file (Edge TTS produces MP3 data)
+        """
+        return self.cache_dir / f"{key}.mp3"
+
+    def _load_from_cache(self, key: str, output_path: str) -> bool:
+        """
+        Copy cached audio to the output path
+
+        Args:
+            key: Cache key
+            output_path: Destination file
+
+        Returns:
+            bool: True on cache hit
+        """
+        cached = self._cache_path(key)
+        try:
+            shutil.copyfile(cached, output_path)
+            # Refresh mtime so eviction treats the entry as recently used
+            os.utime(cached)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _read_cache(self, key: str) -> Optional[bytes]:
+        """
+        Read cached audio data
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[bytes]: Audio data, or None on cache miss
+        """
+        cached = self._cache_path(key)
+        try:
+            data = cached.read_bytes()
+            os.utime(cached)
+            return data
+        except FileNotFoundError:
+            return None
+
+    def _store_in_cache(self, key: str, data: bytes, evict: bool = True) -> None:
+        """
+        Add synthesized audio to the cache and evict old entries
+
+        Args:
+            key: Cache key
+            data: Synthesized audio data
+            evict: Enforce cache_max_bytes after writing (default: True)
+        """
+        try:
+            self._write_atomic(self._cache_path(key), data)
+        except OSError as e:
+            self.logger.warning(f"Could not write TTS cache entry: {e}")
+            return
+
+        if evict:
+            self._evict_cache()
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        """
+        Write data to a temporary file and move it into place
+
+        Readers never see a partially written file.
+
+        Args:
+            path: Destination file
+            data: File contents
+        """
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            with open(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _evict_cache(self) -> None:
+        """Remove least recently used cache files above cache_max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.mp3'):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+        if total <= self.cache_max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.cache_max_bytes:
+                break
+
+    def _split_sentences(self, text: str) -> List[str]:
+        """
+        Split long text into sentences for parallel synthesis
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            List[str]: Sentences, or [text] if the text is short
+        """
+        if not self.split_threshold or len(text) <= self.split_threshold:
+            return [text]
+        return [part for part in _SENTENCE_END.split(text.strip()) if part]
+
+    async def _synthesize_sentences_async(
+        self,
+        sentences: List[str],
+        voice: str,
+        semaphore: asyncio.Semaphore
+    ) -> bytes:
+        """
+        Synthesize sentences concurrently and join their audio
+
+        Args:
+            sentences: Sentences in order
+            voice: Voice name
+            semaphore: Limit on requests in flight
+
+        Returns:
+            bytes: Concatenated MP3 data
+        """
+        async def synthesize_one(sentence: str) -> bytes:
+            key = self._cache_key(sentence, voice) if self.cache_dir else None
+            if key:
+                data = self._read_cache(key)
+                if data is not None:
+                    return data
+
+            async with semaphore:
+                data = await self._stream_audio(sentence, voice)
+
+            if key:
+                self._store_in_cache(key, data, evict=False)
+            return data
+
+        parts = await asyncio.gather(*(synthesize_one(s) for s in sentences))
+        return b''.join(parts)
+
+    async def _stream_audio(self, text: str, voice: str) -> bytes:
+        """
+        Synthesize text into memory
+
+        Args:
+            text: Text to synthesize
+            voice: Voice name
+
+        Returns:
+            bytes: MP3 audio data
+        """
+        communicate = edge_tts.Communicate(
+            text,
+            voice,
+            rate=self._format_rate(self.rate),
+            pitch=self._format_pitch(self.pitch),
+            volume=self._format_volume(self.volume)
+        )
+
+        audio = bytearray()
+        async for chunk in communicate.stream():
+            if chunk['type'] == 'audio':
+                audio += chunk['data']
+        return bytes(audio)
+
     async def _synthesize_async(
         self,
         text: str,
@@ -188,8 +507,6 @@ class EdgeTTS(BaseTTS):
             output_path: Output file path
             voice: Voice name
         """
-        import edge_tts
-
         # Build SSML options for rate and pitch
         rate_str = self._format_rate(self.rate)
         pitch_str = self._format_pitch(self.pitch)
@@ -204,8 +521,16 @@ class EdgeTTS(BaseTTS):
             volume=volume_str
         )
 
-        # Save to file
-        await communicate.save(output_path)
+        # Save next to the output (save() writes audio chunks as they
+        # arrive) and move it into place, like _write_atomic()
+        path = Path(output_path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            await communicate.save(str(tmp_path))
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def _format_rate(self, rate: float) -> str:
         """
@@ -270,7 +595,6 @@ class EdgeTTS(BaseTTS):
         """
         try:
             # Try using ffprobe first (works for all formats)
-            import subprocess
             result = subprocess.run(
                 [
                     'ffprobe', '-v', 'error',
@@ -288,7 +612,6 @@ class EdgeTTS(BaseTTS):
                 return float(result.stdout.strip())
 
             # Fallback to wave module for WAV files
-            import wave
             with wave.open(audio_path, 'rb') as audio:
                 frames = audio.getnframes()
                 rate = audio.getframerate()
@@ -315,17 +638,18 @@ class EdgeTTS(BaseTTS):
         try:
             # Cache voices to avoid repeated API calls
             if self._voices_cache is None:
-                import edge_tts
-                self._voices_cache = asyncio.run(edge_tts.list_voices())
-
-            voices = self._voices_cache
+                voices = asyncio.run(edge_tts.list_voices())
+                # Lowercased locales computed once for language filtering
+                self._voices_cache = [
+                    (v.get('Locale', '').lower(), v) for v in voices
+                ]
 
             # Filter by language if specified
             if language:
-                voices = [
-                    v for v in voices
-                    if v.get('Locale', '').lower().startswith(language.lower())
-                ]
+                prefix = language.lower()
+                voices = [v for locale, v in self._voices_cache if locale.startswith(prefix)]
+            else:
+                voices = [v for _, v in self._voices_cache]
 
             # Format voice info
             result = []
@@ -362,6 +686,10 @@ class EdgeTTS(BaseTTS):
         Returns:
             List[TTSResult]: List of synthesis results
         """
+        # Fail before any request is sent
+        for text in texts:
+            self._check_text(text)
+
         if not self._initialized:
             self.initialize()
 
@@ -400,32 +728,20 @@ class EdgeTTS(BaseTTS):
         Returns:
             List[TTSResult]: Synthesis results
         """
-        import edge_tts
+        # Limit requests in flight to avoid service throttling; shared by
+        # all items and their sentences
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
 
-        tasks = []
-        output_paths = []
-
-        # Create tasks for all texts
-        for i, text in enumerate(texts):
-            file_path = output_dir / f"speech_{i:04d}.wav"
-            output_paths.append(str(file_path))
-
-            rate_str = self._format_rate(self.rate)
-            pitch_str = self._format_pitch(self.pitch)
-            volume_str = self._format_volume(self.volume)
-
-            communicate = edge_tts.Communicate(
-                text,
-                voice,
-                rate=rate_str,
-                pitch=pitch_str,
-                volume=volume_str
-            )
+        output_paths = [str(output_dir / f"speech_{i:04d}.wav") for i in range(len(texts))]
 
-            tasks.append(communicate.save(str(file_path)))
+        # Execute tasks concurrently (bounded by batch_concurrency)
+        await asyncio.gather(*(
+            self._synthesize_to_file_async(text, path, voice, semaphore, evict=False)
+            for text, path in zip(texts, output_paths)
+        ))
 
-        # Execute all tasks concurrently
-        await asyncio.gather(*tasks)
+        if self.cache_dir:
+            self._evict_cache()
 
         # Build results
         results = []
@@ -5,12 +5,19 @@ Base Video Processor
 Abstract base class for video processing components.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from abc import abstractmethod
 from pathlib import Path
+import os
+import stat
+import wave
 
 from speechbridge.core.base import BaseProcessor
 from speechbridge.core.types import VideoInfo
+from speechbridge.core.exceptions import ComponentException
+
+_VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm'})
+_AUDIO_EXTENSIONS = frozenset({'.wav', '.mp3', '.aac', '.flac', '.ogg', '.m4a'})
 
 
 class BaseVideoProcessor(BaseProcessor):
@@ -75,7 +82,8 @@ class BaseVideoProcessor(BaseProcessor):
         video_path: str,
         audio_path: str,
         output_path: str,
-        remove_original_audio: bool = True
+        remove_original_audio: bool = True,
+        subtitle_tracks: Optional[List[Tuple[str, str, str]]] = None
     ) -> Dict[str, Any]:
         """
         Merge audio with video
@@ -85,12 +93,36 @@ class BaseVideoProcessor(BaseProcessor):
             audio_path: Path to audio file
             output_path: Path to save output video
             remove_original_audio: Remove original audio (default: True)
+            subtitle_tracks: Subtitle files to embed in the same pass,
+                as (path, language code, title) tuples (optional)
 
         Returns:
             Dict with merge info
         """
         pass
 
+    def embed_subtitles(
+        self,
+        video_path: str,
+        output_path: str,
+        subtitle_tracks: List[Tuple[str, str, str]]
+    ) -> Dict[str, Any]:
+        """
+        Copy video to output with subtitle tracks embedded
+
+        Args:
+            video_path: Path to input video
+            output_path: Path to save output video
+            subtitle_tracks: (path, language code, title) tuples
+
+        Returns:
+            Dict with remux info
+        """
+        raise ComponentException(
+            "Subtitle embedding not supported",
+            {'processor': self.__class__.__name__}
+        )
+
     @abstractmethod
     def get_video_info(self, video_path: str) -> VideoInfo:
         """
@@ -126,6 +158,40 @@ class BaseVideoProcessor(BaseProcessor):
         """
         pass
 
+    def get_media_duration(self, media_path: str) -> float:
+        """
+        Get media file duration
+
+        The default implementation only understands PCM WAV files;
+        processors override it to probe other formats.
+
+        Args:
+            media_path: Path to media file
+
+        Returns:
+            float: Duration in seconds (0.0 if unknown)
+        """
+        duration = self._read_wav_duration(media_path)
+        return duration if duration is not None else 0.0
+
+    def _read_wav_duration(self, media_path: str) -> Optional[float]:
+        """
+        Read duration from a PCM WAV header without decoding the file
+
+        Args:
+            media_path: Path to media file
+
+        Returns:
+            Optional[float]: Duration in seconds, or None if not a PCM WAV
+        """
+        if not str(media_path).lower().endswith('.wav'):
+            return None
+        try:
+            with wave.open(str(media_path), 'rb') as wav:
+                return wav.getnframes() / float(wav.getframerate())
+        except (wave.Error, EOFError, OSError):
+            return None
+
     def validate_video_path(self, video_path: str) -> bool:
         """
         Validate if video file exists and is accessible
@@ -136,23 +202,7 @@ class BaseVideoProcessor(BaseProcessor):
         Returns:
             bool: True if valid
         """
-        path = Path(video_path)
-        if not path.exists():
-            self.logger.error(f"Video file not found: {video_path}")
-            return False
-
-        if not path.is_file():
-            self.logger.error(f"Path is not a file: {video_path}")
-            return False
-
-        # Check file extension
-        valid_extensions = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm']
-        if path.suffix.lower() not in valid_extensions:
-            self.logger.warning(
-                f"Unusual video extension: {path.suffix}"
-            )
-
-        return True
+        return self._stat_media_file(video_path, 'Video', _VIDEO_EXTENSIONS) is not None
 
     def validate_audio_path(self, audio_path: str) -> bool:
         """
@@ -164,23 +214,45 @@ class BaseVideoProcessor(BaseProcessor):
         Returns:
             bool: True if valid
         """
-        path = Path(audio_path)
-        if not path.exists():
-            self.logger.error(f"Audio file not found: {audio_path}")
-            return False
+        return self._stat_media_file(audio_path, 'Audio', _AUDIO_EXTENSIONS) is not None
+
+    def _stat_media_file(
+        self,
+        media_path: str,
+        kind: str,
+        valid_extensions: frozenset
+    ) -> Optional[os.stat_result]:
+        """
+        Validate a media file with a single stat() call
 
-        if not path.is_file():
-            self.logger.error(f"Path is not a file: {audio_path}")
-            return False
+        Args:
+            media_path: Path to media file
+            kind: 'Video' or 'Audio' (for log messages)
+            valid_extensions: Expected file extensions
+
+        Returns:
+            Optional[os.stat_result]: File status, or None if invalid
+        """
+        path = Path(media_path)
+
+        # One stat() answers both "exists" and "is a regular file"
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.logger.error(f"{kind} file not found: {media_path}")
+            return None
+
+        if not stat.S_ISREG(st.st_mode):
+            self.logger.error(f"Path is not a file: {media_path}")
+            return None
 
         # Check file extension
-        valid_extensions = ['.wav', '.mp3', '.aac', '.flac', '.ogg', '.m4a']
         if path.suffix.lower() not in valid_extensions:
             self.logger.warning(
-                f"Unusual audio extension: {path.suffix}"
+                f"Unusual {kind.lower()} extension: {path.suffix}"
             )
 
-        return True
+        return st
 
     def validate_config(self) -> bool:
         """
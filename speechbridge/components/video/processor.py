@@ -5,17 +5,68 @@ FFmpeg Video Processor
 Video processing using FFmpeg.
 """
 
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+import os
 import subprocess
 import json
 import shutil
 
-from .base import BaseVideoProcessor
+from .base import BaseVideoProcessor, _VIDEO_EXTENSIONS
 from speechbridge.core.types import VideoInfo
 from speechbridge.core.exceptions import ComponentException
 
 
+@lru_cache(maxsize=1)
+def _probe_ffmpeg() -> Tuple[Optional[str], Optional[str], str]:
+    """
+    Locate FFmpeg tools and read the FFmpeg version once per process
+
+    Returns:
+        tuple: (ffmpeg path, ffprobe path, version line)
+    """
+    ffmpeg_path = shutil.which('ffmpeg')
+    ffprobe_path = shutil.which('ffprobe')
+    version_line = ''
+
+    if ffmpeg_path and ffprobe_path:
+        result = subprocess.run(
+            [ffmpeg_path, '-version'],
+            capture_output=True,
+            text=True
+        )
+        version_line = result.stdout.split('\n')[0]
+
+    return ffmpeg_path, ffprobe_path, version_line
+
+
+@lru_cache(maxsize=4)
+def _probe_encoders(ffmpeg_path: str) -> frozenset:
+    """
+    List the encoders compiled into an FFmpeg build (once per binary)
+
+    Args:
+        ffmpeg_path: Path to ffmpeg executable
+
+    Returns:
+        frozenset: Encoder names
+    """
+    result = subprocess.run(
+        [ffmpeg_path, '-hide_banner', '-encoders'],
+        capture_output=True,
+        text=True
+    )
+
+    encoders = set()
+    for line in result.stdout.splitlines():
+        # Lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+        parts = line.split()
+        if len(parts) >= 2 and len(parts[0]) == 6:
+            encoders.add(parts[1])
+    return frozenset(encoders)
+
+
 class FFmpegProcessor(BaseVideoProcessor):
     """
     FFmpeg-based video processor
@@ -33,13 +84,23 @@ class FFmpegProcessor(BaseVideoProcessor):
         Initialize FFmpeg processor
 
         Args:
-            config: Configuration with standard video processor parameters
+            config: Configuration with standard video processor parameters and:
+                - threads: Threads per ffmpeg process, useful to avoid
+                  oversubscription when several jobs run at once
+                  (default: 0, chosen by ffmpeg)
         """
         super().__init__(config)
 
+        # Encoder threads per ffmpeg process (0 = ffmpeg decides)
+        self.threads = self.config.get('threads', 0)
+
         self.ffmpeg_path = None
         self.ffprobe_path = None
 
+        # Probed video info and media durations, keyed by (path, mtime_ns, size)
+        self._video_info_cache: Dict[Tuple[str, int, int], VideoInfo] = {}
+        self._duration_cache: Dict[Tuple[str, int, int], float] = {}
+
     def initialize(self) -> None:
         """
         Initialize FFmpeg processor
@@ -50,8 +111,10 @@ class FFmpegProcessor(BaseVideoProcessor):
             return
 
         try:
+            # Tool paths and version are probed once, not per instance
+            self.ffmpeg_path, self.ffprobe_path, version_line = _probe_ffmpeg()
+
             # Check if ffmpeg is available
-            self.ffmpeg_path = shutil.which('ffmpeg')
             if not self.ffmpeg_path:
                 raise ComponentException(
                     "FFmpeg not found",
@@ -59,21 +122,12 @@ class FFmpegProcessor(BaseVideoProcessor):
                 )
 
             # Check if ffprobe is available
-            self.ffprobe_path = shutil.which('ffprobe')
             if not self.ffprobe_path:
                 raise ComponentException(
                     "FFprobe not found",
                     {'solution': 'Install FFmpeg (includes ffprobe)'}
                 )
 
-            # Get FFmpeg version
-            result = subprocess.run(
-                [self.ffmpeg_path, '-version'],
-                capture_output=True,
-                text=True
-            )
-            version_line = result.stdout.split('\n')[0]
-
             self.logger.info(f"FFmpeg initialized: {version_line}")
 
             # Configure GPU acceleration if available
@@ -88,6 +142,15 @@ class FFmpegProcessor(BaseVideoProcessor):
                 {'ffmpeg': self.ffmpeg_path, 'ffprobe': self.ffprobe_path}
             )
 
+    def _thread_args(self) -> List[str]:
+        """
+        FFmpeg thread count arguments
+
+        Returns:
+            List[str]: ['-threads', N], or [] to let ffmpeg decide
+        """
+        return ['-threads', str(self.threads)] if self.threads else []
+
     def _configure_gpu_acceleration(self) -> None:
         """
         Configure GPU acceleration for FFmpeg
@@ -96,16 +159,19 @@ class FFmpegProcessor(BaseVideoProcessor):
         """
         gpu_info = self.gpu_manager.get_gpu_info()
 
-        if gpu_info['cuda_available']:
+        # A GPU alone isn't enough, the FFmpeg build must include the encoder
+        encoders = _probe_encoders(self.ffmpeg_path)
+
+        if gpu_info['cuda_available'] and 'h264_nvenc' in encoders:
             # NVIDIA GPU - use NVENC
             self.video_codec = 'h264_nvenc'
             self.logger.info("GPU acceleration enabled: NVIDIA NVENC")
-        elif gpu_info['mps_available']:
+        elif gpu_info['mps_available'] and 'h264_videotoolbox' in encoders:
             # Apple Silicon - use VideoToolbox
             self.video_codec = 'h264_videotoolbox'
             self.logger.info("GPU acceleration enabled: Apple VideoToolbox")
         else:
-            self.logger.info("Using CPU encoding")
+            self.logger.info(f"Using CPU encoding ({self.video_codec})")
 
     def extract_audio(
         self,
@@ -144,6 +210,7 @@ class FFmpegProcessor(BaseVideoProcessor):
                 '-acodec', 'pcm_s16le' if audio_format == 'wav' else self.audio_codec,
                 '-ar', '16000',  # Sample rate
                 '-ac', '1',  # Mono
+                *self._thread_args(),
                 '-y',  # Overwrite output
                 audio_path
             ]
@@ -162,7 +229,7 @@ class FFmpegProcessor(BaseVideoProcessor):
                 )
 
             # Get audio duration
-            duration = self._get_media_duration(audio_path)
+            duration = self.get_media_duration(audio_path)
 
             self.logger.info(f"Audio extracted: {duration:.2f}s")
 
@@ -184,7 +251,8 @@ class FFmpegProcessor(BaseVideoProcessor):
         video_path: str,
         audio_path: str,
         output_path: str,
-        remove_original_audio: bool = True
+        remove_original_audio: bool = True,
+        subtitle_tracks: Optional[List[Tuple[str, str, str]]] = None
     ) -> Dict[str, Any]:
         """
         Merge audio with video using FFmpeg
@@ -194,6 +262,8 @@ class FFmpegProcessor(BaseVideoProcessor):
             audio_path: Path to audio file
             output_path: Path to save output video
             remove_original_audio: Remove original audio (default: True)
+            subtitle_tracks: Subtitle files to embed in the same pass,
+                as (path, language code, title) tuples (optional)
 
         Returns:
             Dict with merge info
@@ -211,8 +281,11 @@ class FFmpegProcessor(BaseVideoProcessor):
             self.logger.info(f"Merging audio with video: {output_path}")
 
             # Get audio and video durations
-            audio_duration = self._get_media_duration(audio_path)
-            video_duration = self._get_media_duration(video_path)
+            audio_duration = self.get_media_duration(audio_path)
+            video_duration = self.get_media_duration(video_path)
+
+            # Subtitle tracks are muxed in the same pass (inputs 2, 3, ...)
+            sub_inputs, sub_args = self._subtitle_args(subtitle_tracks or [])
 
             # Build FFmpeg command
             if remove_original_audio:
@@ -229,12 +302,15 @@ class FFmpegProcessor(BaseVideoProcessor):
                         self.ffmpeg_path,
                         '-i', video_path,
                         '-i', audio_path,
+                        *sub_inputs,
                         '-filter_complex', f'[0:v]tpad=stop_mode=clone:stop_duration={pad_duration}[v]',
                         '-map', '[v]',
                         '-map', '1:a:0',
                         '-c:v', self.video_codec,
                         '-c:a', self.audio_codec,
                         '-b:a', self.audio_bitrate,
+                        *sub_args,
+                        *self._thread_args(),
                         '-y',
                         output_path
                     ]
@@ -258,11 +334,14 @@ class FFmpegProcessor(BaseVideoProcessor):
                         self.ffmpeg_path,
                         '-i', video_path,
                         '-i', audio_path,
+                        *sub_inputs,
                         '-map', '0:v:0',
                         '-map', '1:a:0',
                         '-c:v', 'copy',
                         '-c:a', self.audio_codec,
                         '-b:a', self.audio_bitrate,
+                        *sub_args,
+                        *self._thread_args(),
                         '-y',
                         output_path
                     ]
@@ -272,10 +351,15 @@ class FFmpegProcessor(BaseVideoProcessor):
                     self.ffmpeg_path,
                     '-i', video_path,
                     '-i', audio_path,
-                    '-filter_complex', '[0:a][1:a]amix=inputs=2:duration=shortest',
+                    *sub_inputs,
+                    '-filter_complex', '[0:a][1:a]amix=inputs=2:duration=shortest[a]',
+                    '-map', '0:v:0',
+                    '-map', '[a]',
                     '-c:v', 'copy',
                     '-c:a', self.audio_codec,
                     '-b:a', self.audio_bitrate,
+                    *sub_args,
+                    *self._thread_args(),
                     '-y',
                     output_path
                 ]
@@ -294,7 +378,7 @@ class FFmpegProcessor(BaseVideoProcessor):
                 )
 
             # Get output video duration
-            duration = self._get_media_duration(output_path)
+            duration = self.get_media_duration(output_path)
 
             self.logger.info(f"Audio merged successfully: {duration:.2f}s")
 
@@ -302,7 +386,8 @@ class FFmpegProcessor(BaseVideoProcessor):
                 'output_path': output_path,
                 'duration': duration,
                 'video_codec': 'copy',
-                'audio_codec': self.audio_codec
+                'audio_codec': self.audio_codec,
+                'subtitle_tracks': len(subtitle_tracks or [])
             }
 
         except Exception as e:
@@ -311,6 +396,104 @@ class FFmpegProcessor(BaseVideoProcessor):
                 {'video': video_path, 'audio': audio_path, 'output': output_path}
             )
 
+    def embed_subtitles(
+        self,
+        video_path: str,
+        output_path: str,
+        subtitle_tracks: List[Tuple[str, str, str]]
+    ) -> Dict[str, Any]:
+        """
+        Remux video with subtitle tracks, copying video and audio streams
+
+        Args:
+            video_path: Path to input video
+            output_path: Path to save output video (must differ from input)
+            subtitle_tracks: (path, language code, title) tuples
+
+        Returns:
+            Dict with remux info
+        """
+        if not self._initialized:
+            self.initialize()
+
+        if not self.validate_video_path(video_path):
+            raise ComponentException("Invalid video path", {'video_path': video_path})
+
+        try:
+            self.logger.info(f"Embedding {len(subtitle_tracks)} subtitle tracks: {output_path}")
+
+            # Subtitle inputs follow the single video input
+            sub_inputs, sub_args = self._subtitle_args(subtitle_tracks, first_input=1)
+
+            cmd = [
+                self.ffmpeg_path,
+                '-i', video_path,
+                *sub_inputs,
+                '-map', '0:v',
+                '-map', '0:a?',
+                '-c', 'copy',
+                *sub_args,
+                *self._thread_args(),
+                '-y',
+                output_path
+            ]
+
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True
+            )
+
+            if result.returncode != 0:
+                raise ComponentException(
+                    f"FFmpeg subtitle remux failed: {result.stderr}",
+                    {'command': ' '.join(cmd)}
+                )
+
+            return {
+                'output_path': output_path,
+                'subtitle_tracks': len(subtitle_tracks)
+            }
+
+        except Exception as e:
+            raise ComponentException(
+                f"Subtitle embedding failed: {e}",
+                {'video': video_path, 'output': output_path}
+            )
+
+    def _subtitle_args(
+        self,
+        subtitle_tracks: List[Tuple[str, str, str]],
+        first_input: int = 2
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Build FFmpeg arguments for muxing subtitle tracks
+
+        Args:
+            subtitle_tracks: (path, language code, title) tuples
+            first_input: Input index of the first subtitle file
+                (default: 2, after the video and audio inputs)
+
+        Returns:
+            tuple: (input arguments, mapping/codec/metadata arguments)
+        """
+        inputs: List[str] = []
+        args: List[str] = []
+
+        for i, (path, lang_code, title) in enumerate(subtitle_tracks):
+            inputs.extend(['-i', path])
+            args.extend([
+                '-map', f'{i + first_input}:s',
+                f'-metadata:s:s:{i}', f'language={lang_code}',
+                f'-metadata:s:s:{i}', f'title={title}'
+            ])
+
+        if subtitle_tracks:
+            # mov_text is required for QuickTime/MP4
+            args.extend(['-c:s', 'mov_text'])
+
+        return inputs, args
+
     def get_video_info(self, video_path: str) -> VideoInfo:
         """
         Get video file information using FFprobe
@@ -324,9 +507,16 @@ class FFmpegProcessor(BaseVideoProcessor):
         if not self._initialized:
             self.initialize()
 
-        if not self.validate_video_path(video_path):
+        st = self._stat_media_file(video_path, 'Video', _VIDEO_EXTENSIONS)
+        if st is None:
             raise ComponentException("Invalid video path", {'video_path': video_path})
 
+        # Unchanged file: reuse the previous probe
+        cache_key = (str(video_path), st.st_mtime_ns, st.st_size)
+        cached = self._video_info_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         try:
             self.logger.info(f"Getting video info: {video_path}")
 
@@ -378,12 +568,13 @@ class FFmpegProcessor(BaseVideoProcessor):
                 'video_codec': video_stream.get('codec_name', 'unknown') if video_stream else 'none',
                 'audio_codec': audio_stream.get('codec_name', 'unknown') if audio_stream else 'none',
                 'bitrate': int(data['format'].get('bit_rate', 0)),
-                'size': int(data['format'].get('size', 0))
+                'size': st.st_size
             }
 
             self.logger.info(f"Video info: {info['width']}x{info['height']} @ {info['fps']:.2f}fps")
 
-            return info
+            self._video_info_cache[cache_key] = info
+            return dict(info)
 
         except Exception as e:
             raise ComponentException(
@@ -429,6 +620,7 @@ class FFmpegProcessor(BaseVideoProcessor):
                 '-c:v', v_codec,
                 '-c:a', a_codec,
                 '-b:a', self.audio_bitrate,
+                *self._thread_args(),
                 '-y',
                 output_path
             ]
@@ -465,7 +657,7 @@ class FFmpegProcessor(BaseVideoProcessor):
                 {'input': input_path, 'output': output_path}
             )
 
-    def _get_media_duration(self, media_path: str) -> float:
+    def get_media_duration(self, media_path: str) -> float:
         """
         Get media file duration using FFprobe
 
@@ -475,6 +667,30 @@ class FFmpegProcessor(BaseVideoProcessor):
         Returns:
             float: Duration in seconds
         """
+        try:
+            st = os.stat(media_path)
+            cache_key = (str(media_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None:
+            duration = self._duration_cache.get(cache_key)
+            if duration is not None:
+                return duration
+
+            # get_video_info() may already have probed this file
+            info = self._video_info_cache.get(cache_key)
+            if info is not None:
+                return info['duration']
+
+        # PCM WAV (extracted and synchronized audio): read the header
+        # instead of spawning ffprobe
+        duration = self._read_wav_duration(media_path)
+        if duration is not None:
+            if cache_key is not None:
+                self._duration_cache[cache_key] = duration
+            return duration
+
         try:
             cmd = [
                 self.ffprobe_path,
@@ -486,7 +702,11 @@ class FFmpegProcessor(BaseVideoProcessor):
 
             result = subprocess.run(cmd, capture_output=True, text=True)
             data = json.loads(result.stdout)
-            return float(data['format'].get('duration', 0))
+            duration = float(data['format'].get('duration', 0))
+
+            if cache_key is not None:
+                self._duration_cache[cache_key] = duration
+            return duration
 
         except Exception as e:
             self.logger.warning(f"Could not get duration: {e}")
@@ -5,12 +5,14 @@ SpeechBridge Pipeline Builder
 Builder pattern for easy pipeline construction.
 """
 
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, Callable
 from pathlib import Path
 
 from .pipeline import VideoTranslationPipeline
 from ..components.speech.base import BaseSpeechRecognizer
 from ..components.speech.whisper import WhisperRecognizer
+from ..components.speech.faster_whisper import FasterWhisperRecognizer
 from ..components.translation.base import BaseTranslator
 from ..components.translation.deepl import DeepLTranslator
 from ..components.tts.base import BaseTTS
@@ -18,7 +20,6 @@ from ..components.tts.edge_tts import EdgeTTS
 from ..components.video.base import BaseVideoProcessor
 from ..components.video.processor import FFmpegProcessor
 
-
 class PipelineBuilder:
     """
     Builder for VideoTranslationPipeline
@@ -85,6 +86,31 @@ class PipelineBuilder:
         self._speech_recognizer = WhisperRecognizer(config)
         return self
 
+    def with_faster_whisper(
+        self,
+        model: str = 'base',
+        language: str = 'auto',
+        **kwargs
+    ) -> 'PipelineBuilder':
+        """
+        Use faster-whisper (CTranslate2) speech recognizer
+
+        Args:
+            model: Whisper model size (default: 'base')
+            language: Source language (default: 'auto')
+            **kwargs: Additional config (compute_type, vad_filter, ...)
+
+        Returns:
+            PipelineBuilder: Self for chaining
+        """
+        config = {
+            'model': model,
+            'language': language,
+            **kwargs
+        }
+        self._speech_recognizer = FasterWhisperRecognizer(config)
+        return self
+
     # Translation Builders
 
     def with_translator(
@@ -274,6 +300,19 @@ class PipelineBuilder:
         self._pipeline_config['progress_callback'] = callback
         return self
 
+    def with_sync_workers(self, max_workers: int) -> 'PipelineBuilder':
+        """
+        Limit concurrent ffmpeg processes used by audio synchronization
+
+        Args:
+            max_workers: Maximum number of ffmpeg processes
+
+        Returns:
+            PipelineBuilder: Self for chaining
+        """
+        self._pipeline_config['sync_max_workers'] = max_workers
+        return self
+
     def keep_temporary_files(self, keep: bool = True) -> 'PipelineBuilder':
         """
         Configure temporary file retention
@@ -300,16 +339,19 @@ class PipelineBuilder:
             ValueError: If required components are missing
         """
         # Validate components
-        if not self._speech_recognizer:
-            raise ValueError("Speech recognizer not configured. Use with_whisper() or with_speech_recognizer()")
+        if self._speech_recognizer is None:
+            raise ValueError(
+                "Speech recognizer not configured. "
+                "Use with_whisper(), with_faster_whisper() or with_speech_recognizer()"
+            )
 
-        if not self._translator:
+        if self._translator is None:
             raise ValueError("Translator not configured. Use with_deepl() or with_translator()")
 
-        if not self._tts_engine:
+        if self._tts_engine is None:
             raise ValueError("TTS engine not configured. Use with_edge_tts() or with_tts()")
 
-        if not self._video_processor:
+        if self._video_processor is None:
             raise ValueError("Video processor not configured. Use with_ffmpeg() or with_video_processor()")
 
         # Create pipeline
@@ -383,15 +425,16 @@ class PipelineBuilder:
 
     def __repr__(self) -> str:
         """String representation"""
-        components = []
-        if self._speech_recognizer:
-            components.append(f"speech={self._speech_recognizer.__class__.__name__}")
-        if self._translator:
-            components.append(f"translator={self._translator.__class__.__name__}")
-        if self._tts_engine:
-            components.append(f"tts={self._tts_engine.__class__.__name__}")
-        if self._video_processor:
-            components.append(f"video={self._video_processor.__class__.__name__}")
+        components = [
+            f"{name}={component.__class__.__name__}"
+            for name, component in (
+                ('speech', self._speech_recognizer),
+                ('translator', self._translator),
+                ('tts', self._tts_engine),
+                ('video', self._video_processor),
+            )
+            if component is not None
+        ]
 
         return f"PipelineBuilder({', '.join(components)})"
 
@@ -432,3 +475,56 @@ def create_pipeline(
         builder.with_config(**kwargs)
 
     return builder.build()
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineConfig:
+    """
+    Complete pipeline settings in a single value
+
+    Lets scripts construct pipelines in one call via build_from_config()
+    instead of chaining PipelineBuilder methods.
+    """
+
+    whisper_model: str = 'base'
+    whisper_language: str = 'auto'
+    deepl_api_key: Optional[str] = None
+    deepl_target_lang: str = 'en'
+    edge_voice: str = 'en-US-AriaNeural'
+    edge_rate: float = 1.0
+    video_codec: str = 'libx264'
+    audio_codec: str = 'aac'
+    temp_dir: str = 'temp'
+    keep_temp: bool = False
+
+
+def build_from_config(cfg: PipelineConfig) -> VideoTranslationPipeline:
+    """
+    Build pipeline directly from a PipelineConfig
+
+    Args:
+        cfg: Pipeline settings
+
+    Returns:
+        VideoTranslationPipeline: Configured pipeline
+
+    Example:
+        >>> pipeline = build_from_config(
+        ...     PipelineConfig(whisper_model='small', deepl_target_lang='de')
+        ... )
+    """
+    translator_config = {'source_lang': 'auto', 'target_lang': cfg.deepl_target_lang}
+    if cfg.deepl_api_key:
+        translator_config['api_key'] = cfg.deepl_api_key
+
+    return VideoTranslationPipeline(
+        speech_recognizer=WhisperRecognizer(
+            {'model': cfg.whisper_model, 'language': cfg.whisper_language}
+        ),
+        translator=DeepLTranslator(translator_config),
+        tts_engine=EdgeTTS({'voice': cfg.edge_voice, 'rate': cfg.edge_rate}),
+        video_processor=FFmpegProcessor(
+            {'video_codec': cfg.video_codec, 'audio_codec': cfg.audio_codec}
+        ),
+        config={'temp_dir': cfg.temp_dir, 'keep_temp': cfg.keep_temp}
+    )
@@ -11,18 +11,28 @@ Support:
 
 from typing import Optional, Dict, Any
 import logging
+import sys
 
 from .types import GPUInfo, DeviceType
 from .exceptions import GPUException
 
 logger = logging.getLogger(__name__)
 
+# Bound logging methods resolved once at import
+_log_info = logger.info
+_log_warning = logger.warning
+_log_error = logger.error
+_log_debug = logger.debug
+
 
 class GPUManager:
     """GPU manager for automatic detection and utilization"""
 
     _instance = None
     _gpu_info: Optional[GPUInfo] = None
+    _optimal_device: Optional[DeviceType] = None
+    _gpu_available: bool = False
+    _device_name: Optional[str] = None
 
     def __new__(cls):
         """Singleton pattern"""
@@ -34,6 +44,30 @@ class GPUManager:
         """Init GPU manager"""
         if self._gpu_info is None:
             self._gpu_info = self._detect_gpu()
+            self._cache_device_state()
+
+    def _cache_device_state(self) -> None:
+        """Cache values derived from the GPU info for the getters"""
+        info = self._gpu_info
+        self._optimal_device = info['optimal_device']
+        self._gpu_available = info['cuda_available'] or info['mps_available']
+        self._device_name = self._compute_device_name(info)
+
+    def _compute_device_name(self, info: GPUInfo) -> str:
+        """
+        Compute the device name from GPU info
+
+        Args:
+            info: Information about GPU
+
+        Returns:
+            str: Device name
+        """
+        if info['cuda_available'] and info['cuda_device_name']:
+            return info['cuda_device_name']
+        elif info['mps_available']:
+            return "Apple Metal Performance Shaders (MPS)"
+        return "CPU"
 
     def _detect_gpu(self) -> GPUInfo:
         """
@@ -58,11 +92,11 @@ class GPUManager:
             if gpu_info['cuda_available']:
                 gpu_info['cuda_devices'] = torch.cuda.device_count()
                 gpu_info['cuda_device_name'] = torch.cuda.get_device_name(0)
-                logger.info(f"CUDA detected: {gpu_info['cuda_device_name']}")
+                _log_info(f"CUDA detected: {gpu_info['cuda_device_name']}")
         except ImportError:
-            logger.warning("PyTorch not installed, CUDA support disabled")
+            _log_warning("PyTorch not installed, CUDA support disabled")
         except Exception as e:
-            logger.error(f"Error detecting CUDA: {e}")
+            _log_error(f"Error detecting CUDA: {e}")
 
         # Check MPS (Apple Silicon)
         try:
@@ -70,21 +104,23 @@ class GPUManager:
             if hasattr(torch.backends, 'mps'):
                 gpu_info['mps_available'] = torch.backends.mps.is_available()
                 if gpu_info['mps_available']:
-                    logger.info("Apple MPS (Metal Performance Shaders) detected")
+                    _log_info("Apple MPS (Metal Performance Shaders) detected")
         except Exception as e:
-            logger.error(f"Error detecting MPS: {e}")
-
-        # Check TensorFlow GPU
-        try:
-            import tensorflow as tf
-            gpu_devices = tf.config.list_physical_devices('GPU')
-            gpu_info['tensorflow_gpu'] = len(gpu_devices)
-            if gpu_devices:
-                logger.info(f"TensorFlow GPU devices: {len(gpu_devices)}")
-        except ImportError:
-            logger.debug("TensorFlow not installed")
-        except Exception as e:
-            logger.error(f"Error detecting TensorFlow GPU: {e}")
+            _log_error(f"Error detecting MPS: {e}")
+
+        # Check TensorFlow GPU (only if TensorFlow is already loaded;
+        # nothing in SpeechBridge uses it and importing it costs seconds)
+        tf = sys.modules.get('tensorflow')
+        if tf is None:
+            _log_debug("TensorFlow not loaded, skipping TensorFlow GPU check")
+        else:
+            try:
+                gpu_devices = tf.config.list_physical_devices('GPU')
+                gpu_info['tensorflow_gpu'] = len(gpu_devices)
+                if gpu_devices:
+                    _log_info(f"TensorFlow GPU devices: {len(gpu_devices)}")
+            except Exception as e:
+                _log_error(f"Error detecting TensorFlow GPU: {e}")
 
         # Determining the optimal device
         gpu_info['optimal_device'] = self._determine_optimal_device(gpu_info)
@@ -116,6 +152,7 @@ class GPUManager:
         """
         if self._gpu_info is None:
             self._gpu_info = self._detect_gpu()
+            self._cache_device_state()
         return self._gpu_info
 
     def get_optimal_device(self) -> DeviceType:
@@ -125,8 +162,9 @@ class GPUManager:
         Returns:
             DeviceType: Best device ('cuda', 'mps', 'cpu')
         """
-        info = self.get_gpu_info()
-        return info['optimal_device']
+        if self._optimal_device is None:
+            self.get_gpu_info()
+        return self._optimal_device
 
     def is_gpu_available(self) -> bool:
         """
@@ -135,8 +173,9 @@ class GPUManager:
         Returns:
             bool: True if GPU availability
         """
-        info = self.get_gpu_info()
-        return info['cuda_available'] or info['mps_available']
+        if self._optimal_device is None:
+            self.get_gpu_info()
+        return self._gpu_available
 
     def get_device_name(self) -> str:
         """
@@ -145,12 +184,9 @@ class GPUManager:
         Returns:
             str: Device name
         """
-        info = self.get_gpu_info()
-        if info['cuda_available'] and info['cuda_device_name']:
-            return info['cuda_device_name']
-        elif info['mps_available']:
-            return "Apple Metal Performance Shaders (MPS)"
-        return "CPU"
+        if self._device_name is None:
+            self.get_gpu_info()
+        return self._device_name
 
     def set_device(self, device: DeviceType) -> None:
         """
@@ -173,8 +209,9 @@ class GPUManager:
         # Updating the optimal device
         if self._gpu_info:
             self._gpu_info['optimal_device'] = device
+            self._cache_device_state()
 
-        logger.info(f"Device set to: {device}")
+        _log_info(f"Device set to: {device}")
 
     def get_memory_info(self) -> Dict[str, Any]:
         """
@@ -193,7 +230,7 @@ class GPUManager:
                 memory_info['cuda_memory_reserved'] = torch.cuda.memory_reserved(0)
                 memory_info['cuda_max_memory_allocated'] = torch.cuda.max_memory_allocated(0)
             except Exception as e:
-                logger.error(f"Error getting CUDA memory info: {e}")
+                _log_error(f"Error getting CUDA memory info: {e}")
 
         return memory_info
 
@@ -205,6 +242,6 @@ class GPUManager:
             try:
                 import torch
                 torch.cuda.empty_cache()
-                logger.info("CUDA cache cleared")
+                _log_info("CUDA cache cleared")
             except Exception as e:
-                logger.error(f"Error clearing CUDA cache: {e}")
+                _log_error(f"Error clearing CUDA cache: {e}")
@@ -5,10 +5,15 @@ SpeechBridge Pipeline
 Complete video translation pipeline orchestrator.
 """
 
-from typing import Dict, Any, Optional, List, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+import json
 import logging
+import os
+import shutil
 
 from .types import ProcessingResult, TranscriptionResult, TranslationResult, TTSResult, VideoInfo
 from .exceptions import ComponentException
@@ -18,6 +23,13 @@ from ..components.translation.base import BaseTranslator
 from ..components.tts.base import BaseTTS
 from ..components.video.base import BaseVideoProcessor
 
+# Language code mapping for subtitle tracks (2-letter to 3-letter ISO 639-2)
+_SUBTITLE_LANG_MAP = MappingProxyType({
+    'en': 'eng', 'ru': 'rus', 'es': 'spa', 'fr': 'fra', 'de': 'deu',
+    'zh': 'chi', 'ja': 'jpn', 'ko': 'kor', 'it': 'ita', 'pt': 'por',
+    'ar': 'ara', 'hi': 'hin', 'tr': 'tur', 'nl': 'nld', 'pl': 'pol'
+})
+
 
 class VideoTranslationPipeline:
     """
@@ -57,6 +69,8 @@ class VideoTranslationPipeline:
                 - subtitle_only: Only generate subtitles, no audio translation (default: False)
                 - export_text: Export text translation with timing (default: False)
                 - embed_subtitles: Embed subtitles into video file (default: False)
+                - sync_max_workers: Concurrent ffmpeg processes used by audio
+                  synchronization (default: number of CPUs)
         """
         self.speech_recognizer = speech_recognizer
         self.translator = translator
@@ -84,7 +98,9 @@ class VideoTranslationPipeline:
         self.audio_sync = None
         if self.sync_audio:
             from ..components.audio.sync import AudioSynchronizer
-            self.audio_sync = AudioSynchronizer()
+            self.audio_sync = AudioSynchronizer(
+                max_workers=self.config.get('sync_max_workers')
+            )
 
     def process_video(
         self,
@@ -123,6 +139,11 @@ class VideoTranslationPipeline:
         }
 
         try:
+            # Start loading the speech model while audio is being extracted
+            preload = getattr(self.speech_recognizer, 'preload', None)
+            if preload is not None:
+                preload()
+
             # Step 1: Get video info
             self._update_progress(0, "Getting video information")
             video_info = self.video_processor.get_video_info(video_path)
@@ -189,34 +210,10 @@ class VideoTranslationPipeline:
             # Step 4.4: Correct segment timing for initial silence (if sync mode enabled)
             # This ensures subtitles and TTS use corrected timing
             if self.sync_audio and transcription.get('segments') and self.audio_sync:
-                actual_speech_start = 0.0
-                if audio_path.exists():
-                    # Detect actual speech start time
-                    import subprocess
-                    try:
-                        cmd = [
-                            'ffmpeg',
-                            '-i', str(audio_path),
-                            '-af', 'silencedetect=noise=-30dB:d=0.5',
-                            '-f', 'null',
-                            '-'
-                        ]
-                        result_proc = subprocess.run(
-                            cmd,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True,
-                            timeout=60
-                        )
-
-                        # Parse output for first silence_end
-                        for line in result_proc.stderr.split('\n'):
-                            if 'silence_end:' in line:
-                                parts = line.split('silence_end:')[1].split('|')[0].strip()
-                                actual_speech_start = float(parts)
-                                break
-                    except Exception as e:
-                        self.logger.warning(f"Failed to detect speech start: {e}")
+                # Detect actual speech start time (result is reused by
+                # synchronize_segments, so the audio is scanned only once;
+                # a missing file yields 0.0)
+                actual_speech_start = self.audio_sync.detect_speech_start(str(audio_path))
 
                 # Correct first segment timing if needed
                 if actual_speech_start > 0 and transcription['segments']:
@@ -304,7 +301,6 @@ class VideoTranslationPipeline:
                 output_dir = Path(output_path).parent
                 text_export_path = output_dir / f"{output_base}_translation_timing.json"
 
-                import json
                 export_data = {
                     'video': str(video_path),
                     'source_language': translation['source_lang'],
@@ -337,26 +333,36 @@ class VideoTranslationPipeline:
             if self.subtitle_only:
                 self.logger.info("Subtitle-only mode: Skipping audio synthesis and merging")
 
-                # Copy original video to output path
-                import shutil
-                shutil.copy2(video_path, output_path)
-
-                # Embed subtitles if requested
+                # Embed subtitles if requested (remux straight to the output)
+                embedded = False
                 if self.embed_subtitles and subtitle_files:
                     self._update_progress(95, "Embedding subtitles into video")
-                    embedded = self._embed_subtitles_into_video(
-                        output_path,
+                    subtitle_tracks = self._subtitle_tracks(
                         subtitle_files,
-                        output_path,
                         translation['source_lang'],
                         translation['target_lang']
                     )
+                    if subtitle_tracks:
+                        try:
+                            self.video_processor.embed_subtitles(
+                                video_path,
+                                output_path,
+                                subtitle_tracks
+                            )
+                            embedded = True
+                        except ComponentException as e:
+                            self.logger.error(f"Failed to embed subtitles: {e}")
+
                     if embedded:
                         result['metadata']['subtitles_embedded'] = True
                         self.logger.info("Subtitles embedded into video")
                     else:
                         result['warnings'].append("Failed to embed subtitles")
 
+                if not embedded:
+                    # Copy original video to output path
+                    shutil.copy2(video_path, output_path)
+
                 result['success'] = True
                 result['output_path'] = output_path
                 result['metadata']['end_time'] = datetime.now().isoformat()
@@ -391,18 +397,14 @@ class VideoTranslationPipeline:
                 # Update transcription segments with corrected timing for subtitle generation
                 transcription['segments'] = corrected_segments
 
-                # Copy synchronized audio to expected path
-                import shutil
-                shutil.copy2(synced_audio, str(translated_audio_path))
+                # Move synchronized audio to expected path (same temp
+                # filesystem, so this is a rename rather than a copy)
+                os.replace(synced_audio, translated_audio_path)
 
-                # Get duration from synchronized audio
-                import subprocess
-                probe_result = subprocess.run(
-                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                     '-of', 'default=noprint_wrappers=1:nokey=1', str(translated_audio_path)],
-                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                # Get duration from synchronized audio (PCM WAV header)
+                tts_duration = self.video_processor.get_media_duration(
+                    str(translated_audio_path)
                 )
-                tts_duration = float(probe_result.stdout.strip()) if probe_result.returncode == 0 else 0.0
 
                 tts_result = {
                     'audio_path': str(translated_audio_path),
@@ -422,32 +424,46 @@ class VideoTranslationPipeline:
             result['tts'] = tts_result
             self.logger.info(f"Speech synthesis complete: {tts_result['duration']:.2f}s")
 
-            # Step 6: Merge audio with video
-            self._update_progress(90, "Merging audio with video")
-            merge_info = self.video_processor.merge_audio(
-                video_path,
-                str(translated_audio_path),
-                output_path,
-                remove_original_audio=True
-            )
-            self.logger.info(f"Audio merged: {output_path}")
-
-            # Step 7: Embed subtitles if requested
+            # Step 6: Merge audio with video (subtitles are embedded in the
+            # same ffmpeg pass, so the video is written only once)
+            subtitle_tracks = []
             if self.embed_subtitles and subtitle_files:
-                self._update_progress(95, "Embedding subtitles into video")
-                embedded = self._embed_subtitles_into_video(
-                    output_path,
+                subtitle_tracks = self._subtitle_tracks(
                     subtitle_files,
-                    output_path,
                     translation['source_lang'],
                     translation['target_lang']
                 )
-                if embedded:
-                    result['metadata']['subtitles_embedded'] = True
-                    self.logger.info("Subtitles embedded into video")
-                else:
+                if not subtitle_tracks:
                     result['warnings'].append("Failed to embed subtitles")
-                    self.logger.warning("Failed to embed subtitles, but processing continues")
+
+            self._update_progress(90, "Merging audio with video")
+            try:
+                merge_info = self.video_processor.merge_audio(
+                    video_path,
+                    str(translated_audio_path),
+                    output_path,
+                    remove_original_audio=True,
+                    subtitle_tracks=subtitle_tracks
+                )
+            except ComponentException as e:
+                if not subtitle_tracks:
+                    raise
+                # Keep the translated video even if subtitles can't be muxed
+                self.logger.error(f"Failed to embed subtitles: {e}")
+                self.logger.warning("Failed to embed subtitles, but processing continues")
+                result['warnings'].append("Failed to embed subtitles")
+                subtitle_tracks = []
+                merge_info = self.video_processor.merge_audio(
+                    video_path,
+                    str(translated_audio_path),
+                    output_path,
+                    remove_original_audio=True
+                )
+            self.logger.info(f"Audio merged: {output_path}")
+
+            if subtitle_tracks:
+                result['metadata']['subtitles_embedded'] = True
+                self.logger.info("Subtitles embedded into video")
 
             # Success
             result['success'] = True
@@ -527,6 +543,39 @@ class VideoTranslationPipeline:
 
         return results
 
+    def _validate_component(self, name: str, component: Any) -> Optional[str]:
+        """
+        Initialize and validate a single component
+
+        Args:
+            name: Component display name
+            component: Component instance
+
+        Returns:
+            Optional[str]: Error message, or None if valid
+        """
+        try:
+            # Initialize component
+            if not component._initialized:
+                self.logger.info(f"Initializing {name}...")
+                component.initialize()
+                self.logger.info(f"✓ {name} initialized")
+
+            # Validate config
+            self.logger.info(f"Validating {name} configuration...")
+            if not component.validate_config():
+                error_msg = f"{name} configuration is invalid"
+                self.logger.error(error_msg)
+                return error_msg
+
+            self.logger.info(f"✓ {name} validated")
+            return None
+
+        except Exception as e:
+            error_msg = f"{name} validation failed: {e}"
+            self.logger.error(error_msg)
+            return error_msg
+
     def validate_components(self) -> bool:
         """
         Validate all pipeline components
@@ -543,32 +592,13 @@ class VideoTranslationPipeline:
             ('Video Processor', self.video_processor)
         ]
 
-        all_valid = True
-        errors = []
+        # Components are independent (model load, API check, ffmpeg probe),
+        # so they are initialized concurrently
+        with ThreadPoolExecutor(max_workers=len(components)) as pool:
+            results = list(pool.map(lambda item: self._validate_component(*item), components))
 
-        for name, component in components:
-            try:
-                # Initialize component
-                if not component._initialized:
-                    self.logger.info(f"Initializing {name}...")
-                    component.initialize()
-                    self.logger.info(f"✓ {name} initialized")
-
-                # Validate config
-                self.logger.info(f"Validating {name} configuration...")
-                if not component.validate_config():
-                    error_msg = f"{name} configuration is invalid"
-                    self.logger.error(error_msg)
-                    errors.append(error_msg)
-                    all_valid = False
-                else:
-                    self.logger.info(f"✓ {name} validated")
-
-            except Exception as e:
-                error_msg = f"{name} validation failed: {e}"
-                self.logger.error(error_msg)
-                errors.append(error_msg)
-                all_valid = False
+        errors = [error for error in results if error]
+        all_valid = not errors
 
         if not all_valid:
             self.logger.error("=" * 60)
@@ -612,135 +642,66 @@ class VideoTranslationPipeline:
             except Exception as e:
                 self.logger.warning(f"Progress callback failed: {e}")
 
-    def _embed_subtitles_into_video(
+    def _subtitle_tracks(
         self,
-        video_path: str,
         subtitle_files: List[str],
-        output_path: str,
         source_lang: str,
         target_lang: str
-    ) -> bool:
+    ) -> List[Tuple[str, str, str]]:
         """
-        Embed subtitle tracks into video file
+        Describe subtitle files as tracks to embed into the video
 
         Args:
-            video_path: Path to input video
             subtitle_files: List of subtitle file paths
-            output_path: Path to save output video
             source_lang: Source language code (e.g., 'en')
             target_lang: Target language code (e.g., 'ru')
 
         Returns:
-            bool: True if successful
+            List of (path, language code, title) tuples
         """
-        import subprocess
-
-        # Language code mapping (2-letter to 3-letter ISO 639-2)
-        lang_map = {
-            'en': 'eng', 'ru': 'rus', 'es': 'spa', 'fr': 'fra', 'de': 'deu',
-            'zh': 'chi', 'ja': 'jpn', 'ko': 'kor', 'it': 'ita', 'pt': 'por',
-            'ar': 'ara', 'hi': 'hin', 'tr': 'tur', 'nl': 'nld', 'pl': 'pol'
-        }
 
         # Filter SRT files only (FFmpeg mov_text works best with SRT)
         srt_files = [f for f in subtitle_files if f.endswith('.srt')]
 
         if not srt_files:
             self.logger.warning("No SRT subtitle files to embed")
-            return False
+            return []
 
         self.logger.info(f"Embedding {len(srt_files)} subtitle tracks into video")
 
-        # Build FFmpeg command
-        cmd = ['ffmpeg', '-y', '-i', video_path]
-
-        # Add subtitle inputs
-        for sub_file in srt_files:
-            cmd.extend(['-i', sub_file])
-
-        # Map video and audio from original
-        cmd.extend(['-map', '0:v', '-map', '0:a'])
-
-        # Map each subtitle track
-        for i in range(len(srt_files)):
-            cmd.extend(['-map', f'{i+1}:s'])
-
-        # Copy video and audio codecs
-        cmd.extend(['-c:v', 'copy', '-c:a', 'copy'])
-
-        # Set subtitle codec to mov_text (required for QuickTime/MP4)
-        cmd.extend(['-c:s', 'mov_text'])
-
-        # IMPORTANT: Don't use -shortest when embedding subtitles
-        # We want to preserve the full video/audio duration
-        # Subtitles that extend beyond video will just not display
-        # This prevents cutting the video to subtitle length
-
-        # Set metadata for each subtitle track
-        subtitle_index = 0
+        tracks = []
         for sub_file in srt_files:
             filename = Path(sub_file).stem
 
             # Determine language and label
             if 'original' in filename:
-                lang_code = lang_map.get(source_lang, source_lang)
+                lang_code = _SUBTITLE_LANG_MAP.get(source_lang, source_lang)
                 label = f"{source_lang.upper()} (Original)"
             elif 'translated' in filename:
-                lang_code = lang_map.get(target_lang, target_lang)
+                lang_code = _SUBTITLE_LANG_MAP.get(target_lang, target_lang)
                 label = f"{target_lang.upper()} (Translated)"
             else:
                 lang_code = 'und'  # undefined
                 label = "Subtitles"
 
-            cmd.extend([
-                f'-metadata:s:s:{subtitle_index}', f'language={lang_code}',
-                f'-metadata:s:s:{subtitle_index}', f'title={label}'
-            ])
-            subtitle_index += 1
-
-            self.logger.info(f"  Track {subtitle_index}: {label} [{lang_code}]")
-
-        # Create temp output with different name
-        temp_output = str(Path(output_path).with_suffix('.tmp.mp4'))
-        cmd.append(temp_output)
-
-        # Execute FFmpeg
-        try:
-            self.logger.info("Running FFmpeg to embed subtitles...")
-            result = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True
-            )
-
-            # Replace original with embedded version
-            import shutil
-            shutil.move(temp_output, output_path)
-
-            self.logger.info("✓ Subtitles embedded successfully")
-            return True
-
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to embed subtitles: {e}")
-            self.logger.error(f"FFmpeg error: {e.stderr}")
-
-            # Clean up temp file if it exists
-            if Path(temp_output).exists():
-                Path(temp_output).unlink()
+            tracks.append((sub_file, lang_code, label))
+            self.logger.info(f"  Track {len(tracks)}: {label} [{lang_code}]")
 
-            return False
+        return tracks
 
     def _cleanup_temp_files(self) -> None:
         """
         Cleanup temporary files
         """
         try:
-            if self.temp_dir.exists():
-                for file in self.temp_dir.glob('*'):
-                    if file.is_file():
-                        file.unlink()
-                self.logger.info("Temporary files cleaned up")
+            # scandir() entries carry the file type, so no extra stat per file
+            with os.scandir(self.temp_dir) as it:
+                for entry in it:
+                    if entry.is_file():
+                        os.unlink(entry.path)
+            self.logger.info("Temporary files cleaned up")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.warning(f"Failed to cleanup temp files: {e}")
 
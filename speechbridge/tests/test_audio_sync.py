@@ -0,0 +1,151 @@
+"""
+Audio Synchronizer Tests
+========================
+
+Timeline assembly and speech onset detection on synthetic WAV files.
+"""
+
+from array import array
+import math
+import wave
+
+import pytest
+
+from speechbridge.components.audio.sync import AudioSynchronizer
+from speechbridge.core.exceptions import ComponentException
+
+RATE = AudioSynchronizer.SAMPLE_RATE
+
+
+def _write_constant_wav(path, value, seconds, rate=RATE, channels=2):
+    """Write a WAV whose samples all equal `value`"""
+    frames = int(round(seconds * rate))
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(array('h', [value] * (frames * channels)).tobytes())
+    return str(path)
+
+
+def _read_left_channel(path):
+    with wave.open(str(path), 'rb') as wav:
+        assert wav.getnchannels() == 2
+        assert wav.getframerate() == RATE
+        samples = array('h', wav.readframes(wav.getnframes()))
+    return samples[::2]
+
+
+def _frame(seconds):
+    return int(round(seconds * RATE))
+
+
+def test_timeline_places_segments(tmp_path):
+    segments = [
+        # Shorter than its slot: zero-padded to the end time
+        {'start': 0.1, 'end': 0.3, 'file': _write_constant_wav(tmp_path / 'a.wav', 1000, 0.1)},
+        # Longer than its slot: trimmed at the end time
+        {'start': 0.5, 'end': 0.6, 'file': _write_constant_wav(tmp_path / 'b.wav', 2000, 0.3)},
+        # Overlaps the previous segment: starts when it ends
+        {'start': 0.55, 'end': 0.8, 'file': _write_constant_wav(tmp_path / 'c.wav', 3000, 0.5)},
+        # Blank text: silent slot
+        {'start': 0.9, 'end': 1.0, 'file': None},
+    ]
+    output = tmp_path / 'synced.wav'
+
+    AudioSynchronizer()._create_synchronized_audio(segments, output, total_duration=1.2)
+
+    left = _read_left_channel(output)
+    assert len(left) == _frame(1.2)
+
+    expected = array('h', [0] * _frame(1.2))
+    expected[_frame(0.1):_frame(0.2)] = array('h', [1000] * (_frame(0.2) - _frame(0.1)))
+    expected[_frame(0.5):_frame(0.6)] = array('h', [2000] * (_frame(0.6) - _frame(0.5)))
+    expected[_frame(0.6):_frame(0.8)] = array('h', [3000] * (_frame(0.8) - _frame(0.6)))
+    assert left == expected
+
+
+def test_timeline_without_final_padding(tmp_path):
+    segments = [
+        {'start': 0.0, 'end': 0.25, 'file': _write_constant_wav(tmp_path / 'a.wav', 500, 0.25)},
+    ]
+    output = tmp_path / 'synced.wav'
+
+    # Segments already reach past total_duration: nothing is cut or padded
+    AudioSynchronizer()._create_synchronized_audio(segments, output, total_duration=0.2)
+
+    left = _read_left_channel(output)
+    assert left == array('h', [500] * _frame(0.25))
+
+
+def test_timeline_rejects_missing_segment_file(tmp_path):
+    segments = [{'start': 0.0, 'end': 0.1, 'file': str(tmp_path / 'missing.wav')}]
+
+    with pytest.raises(ComponentException):
+        AudioSynchronizer()._create_synchronized_audio(segments, tmp_path / 'out.wav', 0.1)
+
+
+def test_timeline_rejects_mismatched_segment_format(tmp_path):
+    mono = _write_constant_wav(tmp_path / 'mono.wav', 1000, 0.1, rate=16000, channels=1)
+    segments = [{'start': 0.0, 'end': 0.1, 'file': mono}]
+
+    with pytest.raises(ComponentException):
+        AudioSynchronizer()._create_synchronized_audio(segments, tmp_path / 'out.wav', 0.1)
+
+
+def _write_onset_wav(path, silence, amplitude, rate=RATE, channels=2, tone=1.0):
+    """Write `silence` seconds of silence followed by a sine tone"""
+    np = pytest.importorskip('numpy')
+
+    n_silence = int(silence * rate)
+    t = np.arange(int(tone * rate)) / rate
+    signal = np.concatenate([
+        np.zeros(n_silence),
+        amplitude * np.sin(2 * math.pi * 220 * t)
+    ])
+    pcm = np.round(signal * 32767).astype('<i2')
+    frames = np.repeat(pcm[:, None], channels, axis=1)
+
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(frames.tobytes())
+
+
+def test_quiet_onset_is_detected(tmp_path):
+    # Peak -28 dBFS, RMS -31 dBFS: quiet speech still ends the silence
+    path = tmp_path / 'quiet.wav'
+    _write_onset_wav(path, silence=1.5, amplitude=0.04)
+
+    assert AudioSynchronizer().detect_speech_start(str(path)) == pytest.approx(1.5, abs=0.01)
+
+
+def test_onset_on_one_channel_only(tmp_path):
+    path = tmp_path / 'left.wav'
+    _write_onset_wav(path, silence=2.0, amplitude=0.5)
+
+    # Silence the right channel
+    with wave.open(str(path), 'rb') as wav:
+        params = wav.getparams()
+        frames = array('h', wav.readframes(params.nframes))
+    frames[1::2] = array('h', [0] * (len(frames) // 2))
+    with wave.open(str(path), 'wb') as wav:
+        wav.setparams(params)
+        wav.writeframes(frames.tobytes())
+
+    assert AudioSynchronizer().detect_speech_start(str(path)) == pytest.approx(2.0, abs=0.01)
+
+
+def test_short_leading_silence_is_ignored(tmp_path):
+    path = tmp_path / 'short.wav'
+    _write_onset_wav(path, silence=0.2, amplitude=0.5, rate=16000, channels=1)
+
+    assert AudioSynchronizer().detect_speech_start(str(path)) == 0.0
+
+
+def test_silent_preamble_keeps_original_timing(tmp_path):
+    path = tmp_path / 'silent.wav'
+    _write_onset_wav(path, silence=3.0, amplitude=0.001, rate=16000, channels=1)
+
+    assert AudioSynchronizer().detect_speech_start(str(path)) == 0.0
@@ -0,0 +1,27 @@
+"""
+Pipeline Builder Tests
+======================
+
+Component validation in PipelineBuilder.build().
+"""
+
+import pytest
+
+from speechbridge.core.builder import PipelineBuilder
+
+
+def test_build_requires_all_components():
+    with pytest.raises(ValueError, match="Speech recognizer not configured"):
+        PipelineBuilder().build()
+
+
+def test_none_component_is_not_configured():
+    builder = (PipelineBuilder()
+               .with_speech_recognizer(object())
+               .with_translator(object())
+               .with_tts(None)
+               .with_video_processor(object()))
+
+    with pytest.raises(ValueError, match="TTS engine not configured"):
+        builder.build()
+    assert 'tts=' not in repr(builder)
@@ -0,0 +1,100 @@
+"""
+Logging Tests
+=============
+
+Session headers and archive error scanning of SpeechBridgeLogger.
+"""
+
+import logging
+
+import pytest
+
+from speechbridge.utils.logging import _scan_error_lines, setup_logging
+
+HEADER = "SpeechBridge session started at"
+
+
+@pytest.fixture(autouse=True)
+def close_handlers():
+    yield
+    root_logger = logging.getLogger('speechbridge')
+    for handler in root_logger.handlers:
+        handler.close()
+    root_logger.handlers.clear()
+
+
+def test_each_archive_gets_a_session_header(tmp_path):
+    first = setup_logging(str(tmp_path / 'a'), console_output=False)
+    second = setup_logging(str(tmp_path / 'b'), console_output=False)
+
+    assert first.read_archive_log().count(HEADER) == 1
+    assert second.read_archive_log().count(HEADER) == 1
+    assert second.read_current_log().count(HEADER) == 1
+
+
+def test_reopened_archive_is_not_marked_twice(tmp_path):
+    setup_logging(str(tmp_path), console_output=False)
+    again = setup_logging(str(tmp_path), console_output=False)
+
+    assert again.read_archive_log().count(HEADER) == 1
+    # The current log was truncated, so it gets the header again
+    assert again.read_current_log().count(HEADER) == 1
+
+
+def test_forced_session_marker(tmp_path):
+    setup_logging(str(tmp_path), console_output=False)
+    again = setup_logging(str(tmp_path), console_output=False, force_session_marker=True)
+
+    assert again.read_archive_log().count(HEADER) == 2
+
+
+LOG = (
+    b"[2024-01-01 10:00:00] [INFO] [speechbridge] start\n"
+    b"[2024-01-01 10:00:01] [ERROR] [speechbridge] first\n"
+    b"[2024-01-01 10:00:02] [INFO] [speechbridge] mid\n"
+    b"[2024-01-01 10:00:03] [ERROR] [speechbridge] second\n"
+    b"[2024-01-01 10:00:04] [ERROR] [speechbridge] third"
+)
+
+
+def test_scan_error_lines_returns_last_errors_in_order():
+    assert _scan_error_lines(LOG, 2) == [
+        b"[2024-01-01 10:00:03] [ERROR] [speechbridge] second",
+        b"[2024-01-01 10:00:04] [ERROR] [speechbridge] third",
+    ]
+
+
+def test_scan_error_lines_fewer_errors_than_requested():
+    lines = _scan_error_lines(LOG, 10)
+    assert [line.rsplit(b' ', 1)[1] for line in lines] == [b'first', b'second', b'third']
+
+
+def test_scan_error_lines_without_errors():
+    assert _scan_error_lines(b"[INFO] nothing here\n", 5) == []
+    assert _scan_error_lines(b"", 5) == []
+
+
+def test_scan_error_lines_one_match_per_line():
+    buf = b"[ERROR] a [ERROR] b\n[INFO] c\n"
+    assert _scan_error_lines(buf, 5) == [b"[ERROR] a [ERROR] b"]
+
+
+def test_read_archive_errors(tmp_path):
+    logger_system = setup_logging(str(tmp_path), console_output=False)
+    logger = logger_system.get_logger('test')
+    for i in range(5):
+        logger.error(f"failure {i}")
+    logger.info("done")
+
+    errors = logger_system.read_archive_errors(max_errors=2).splitlines()
+    assert [line.rsplit(' ', 1)[1] for line in errors] == ['3', '4']
+
+
+def test_read_archive_errors_empty_or_missing(tmp_path):
+    logger_system = setup_logging(str(tmp_path), console_output=False)
+
+    logger_system.archive_log.write_bytes(b"")
+    assert logger_system.read_archive_errors() == ""
+
+    logger_system.archive_log.unlink()
+    assert logger_system.read_archive_errors() == ""
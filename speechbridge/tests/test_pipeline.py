@@ -0,0 +1,119 @@
+"""
+Pipeline Tests
+==============
+
+Run VideoTranslationPipeline branches with in-memory components.
+"""
+
+from speechbridge.core.exceptions import ComponentException
+from speechbridge.core.pipeline import VideoTranslationPipeline
+
+
+SEGMENTS = [
+    {'start': 0.0, 'end': 1.5, 'text': 'Hello there'},
+    {'start': 2.0, 'end': 3.0, 'text': 'Goodbye'},
+]
+
+
+class FakeRecognizer:
+    def transcribe(self, audio_path):
+        return {
+            'text': 'Hello there Goodbye',
+            'language': 'en',
+            'confidence': 1.0,
+            'segments': [dict(seg) for seg in SEGMENTS],
+            'duration': 3.0
+        }
+
+
+class FakeTranslator:
+    target_lang = 'ru'
+
+    def translate(self, text, source_lang=None, target_lang=None):
+        return {
+            'text': 'Привет Пока',
+            'source_lang': source_lang,
+            'target_lang': target_lang or self.target_lang,
+            'segments': ['Привет', 'Пока']
+        }
+
+
+class FakeVideoProcessor:
+    def __init__(self, embed_error=None):
+        self.embed_error = embed_error
+        self.embed_calls = []
+
+    def get_video_info(self, video_path):
+        return {'width': 640, 'height': 360, 'fps': 25.0, 'duration': 3.0}
+
+    def extract_audio(self, video_path, audio_path):
+        return {'duration': 3.0}
+
+    def embed_subtitles(self, video_path, output_path, subtitle_tracks):
+        self.embed_calls.append((video_path, output_path, subtitle_tracks))
+        if self.embed_error:
+            raise self.embed_error
+        with open(output_path, 'wb') as f:
+            f.write(b'remuxed')
+        return {'output_path': output_path, 'subtitle_tracks': len(subtitle_tracks)}
+
+
+def _run_subtitle_only(tmp_path, processor):
+    video = tmp_path / 'input.mp4'
+    video.write_bytes(b'original')
+    output = tmp_path / 'output.mp4'
+
+    pipeline = VideoTranslationPipeline(
+        FakeRecognizer(),
+        FakeTranslator(),
+        tts_engine=None,
+        video_processor=processor,
+        config={
+            'temp_dir': str(tmp_path / 'temp'),
+            'sync_audio': False,
+            'subtitle_only': True,
+            'embed_subtitles': True
+        }
+    )
+    return pipeline.process_video(str(video), str(output)), video, output
+
+
+def test_subtitle_only_embeds_subtitles(tmp_path):
+    processor = FakeVideoProcessor()
+    result, video, output = _run_subtitle_only(tmp_path, processor)
+
+    assert result['success'], result['errors']
+    assert result['metadata']['subtitles_embedded'] is True
+    assert output.read_bytes() == b'remuxed'
+
+    [(video_path, output_path, tracks)] = processor.embed_calls
+    assert video_path == str(video)
+    assert output_path == str(output)
+    assert [(lang, title) for _, lang, title in tracks] == [
+        ('eng', 'EN (Original)'),
+        ('rus', 'RU (Translated)'),
+    ]
+
+
+def test_subtitle_only_copies_video_when_embedding_fails(tmp_path):
+    processor = FakeVideoProcessor(embed_error=ComponentException("remux failed"))
+    result, video, output = _run_subtitle_only(tmp_path, processor)
+
+    assert result['success'], result['errors']
+    assert 'subtitles_embedded' not in result['metadata']
+    assert "Failed to embed subtitles" in result['warnings']
+    assert output.read_bytes() == b'original'
+
+
+def test_subtitle_remux_args_follow_single_input():
+    from speechbridge.components.video.processor import FFmpegProcessor
+
+    inputs, args = FFmpegProcessor()._subtitle_args(
+        [('a.srt', 'eng', 'EN'), ('b.srt', 'rus', 'RU')],
+        first_input=1
+    )
+
+    assert inputs == ['-i', 'a.srt', '-i', 'b.srt']
+    assert args[args.index('-map') + 1] == '1:s'
+    assert '2:s' in args
+    assert args[-2:] == ['-c:s', 'mov_text']
@@ -0,0 +1,63 @@
+"""
+Whisper Recognizer Tests
+========================
+
+Transcription result cache, without loading a model.
+"""
+
+from speechbridge.components.speech.whisper import WhisperRecognizer
+
+
+class CountingRecognizer(WhisperRecognizer):
+    """Recognizer returning a canned transcription and counting runs"""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self._initialized = True
+        self.runs = 0
+
+    def _transcribe_file(self, audio_path):
+        self.runs += 1
+        return {
+            'text': 'hello',
+            'language': 'en',
+            'confidence': 1.0,
+            'segments': [{'start': 0.0, 'end': 1.0, 'text': 'hello'}],
+            'duration': 1.0
+        }
+
+
+def test_result_cache_is_disabled_by_default(tmp_path):
+    audio = tmp_path / 'audio.wav'
+    audio.write_bytes(b'data')
+    recognizer = CountingRecognizer()
+
+    recognizer.transcribe(str(audio))
+    recognizer.transcribe(str(audio))
+
+    assert recognizer.runs == 2
+
+
+def test_result_cache_hit_returns_independent_copy(tmp_path):
+    audio = tmp_path / 'audio.wav'
+    audio.write_bytes(b'data')
+    recognizer = CountingRecognizer({'result_cache_size': 4})
+
+    first = recognizer.transcribe(str(audio))
+    first['segments'][0]['start'] = 0.5  # Callers adjust timing in place
+    second = recognizer.transcribe(str(audio))
+
+    assert recognizer.runs == 1
+    assert second['segments'][0]['start'] == 0.0
+
+
+def test_result_cache_misses_after_file_change(tmp_path):
+    audio = tmp_path / 'audio.wav'
+    audio.write_bytes(b'data')
+    recognizer = CountingRecognizer({'result_cache_size': 4})
+
+    recognizer.transcribe(str(audio))
+    audio.write_bytes(b'other data')
+    recognizer.transcribe(str(audio))
+
+    assert recognizer.runs == 2
@@ -9,10 +9,107 @@ Rotating log system with overwrite on each run:
 """
 
 import logging
+import mmap
+import os
 import sys
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Set, Union
+
+# Resolved archive paths that already got a session header in this process
+_SESSION_ARCHIVES: Set[str] = set()
+
+
+def _scan_error_lines(
+    buf: Union[bytes, mmap.mmap],
+    max_errors: int,
+    marker: bytes = b'[ERROR]'
+) -> List[bytes]:
+    """
+    Collect the last error lines from a raw log buffer
+
+    Scans backwards with rfind() so only the tail that holds the
+    requested lines is touched, without splitting the buffer into lines.
+
+    Args:
+        buf: Raw log contents (bytes or a memory-mapped file)
+        max_errors: Maximum number of lines to return
+        marker: Level marker to search for (default: b'[ERROR]')
+
+    Returns:
+        List[bytes]: Matching lines in file order
+    """
+    found: List[bytes] = []
+    end = len(buf)
+
+    while len(found) < max_errors:
+        pos = buf.rfind(marker, 0, end)
+        if pos < 0:
+            break
+
+        line_start = buf.rfind(b'\n', 0, pos) + 1
+        line_end = buf.find(b'\n', pos)
+        if line_end < 0:
+            line_end = len(buf)
+
+        found.append(buf[line_start:line_end])
+        end = line_start
+
+    found.reverse()
+    return found
+
+
+class DualFileHandler(logging.Handler):
+    """
+    Handler writing each record to the current and archive logs
+
+    The record is formatted and encoded once, then written to both
+    files with a single os.write() per file.
+    """
+
+    terminator = '\n'
+
+    def __init__(self, current_path: Path, archive_path: Path, encoding: str = 'utf-8'):
+        """
+        Args:
+            current_path: Current log file (truncated on open)
+            archive_path: Archive log file (appended to)
+            encoding: File encoding (default: 'utf-8')
+        """
+        super().__init__()
+        self.encoding = encoding
+        self.fd_current = os.open(current_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self.fd_archive = os.open(archive_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format record once and write it to both log files"""
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            os.write(self.fd_current, data)
+            os.write(self.fd_archive, data)
+        except Exception:
+            self.handleError(record)
+
+    def emit_current(self, record: logging.LogRecord) -> None:
+        """Format record and write it to the current log only"""
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            os.write(self.fd_current, data)
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Close both file descriptors"""
+        self.acquire()
+        try:
+            for fd in (self.fd_current, self.fd_archive):
+                if fd is not None:
+                    os.close(fd)
+            self.fd_current = self.fd_archive = None
+        finally:
+            self.release()
+            super().close()
 
 
 class SpeechBridgeLogger:
@@ -33,7 +130,8 @@ class SpeechBridgeLogger:
         self,
         log_dir: str = "logs",
         log_level: int = logging.DEBUG,
-        console_output: bool = True
+        console_output: bool = True,
+        force_session_marker: bool = False
     ):
         """
         Initialize logger system
@@ -42,10 +140,14 @@ class SpeechBridgeLogger:
             log_dir: Directory for log files (default: "logs")
             log_level: Logging level (default: DEBUG)
             console_output: Whether to output to console (default: True)
+            force_session_marker: Write the session header to the archive
+                even if this process already wrote one there (default: False)
         """
         self.log_dir = Path(log_dir)
         self.log_level = log_level
         self.console_output = console_output
+        self.force_session_marker = force_session_marker
+        self._loggers: dict[str, logging.Logger] = {}
 
         # Create log directory
         self.log_dir.mkdir(exist_ok=True, parents=True)
@@ -62,8 +164,7 @@ class SpeechBridgeLogger:
         Configure logging handlers
 
         Creates:
-        - Current log handler (mode='w' - overwrite)
-        - Archive log handler (mode='a' - append)
+        - File handler for current log (overwrite) and archive log (append)
         - Console handler (optional)
         """
         # Create formatter
@@ -77,27 +178,19 @@ class SpeechBridgeLogger:
         root_logger.setLevel(self.log_level)
 
         # Remove existing handlers to avoid duplicates
+        for handler in root_logger.handlers:
+            handler.close()
         root_logger.handlers.clear()
 
-        # Current log handler (overwrite mode)
-        current_handler = logging.FileHandler(
+        # Current log (overwritten on each run) + archive log (appended)
+        file_handler = DualFileHandler(
             self.current_log,
-            mode='w',  # Overwrite on each run
-            encoding='utf-8'
-        )
-        current_handler.setLevel(self.log_level)
-        current_handler.setFormatter(formatter)
-        root_logger.addHandler(current_handler)
-
-        # Archive log handler (append mode)
-        archive_handler = logging.FileHandler(
             self.archive_log,
-            mode='a',  # Append to archive
             encoding='utf-8'
         )
-        archive_handler.setLevel(self.log_level)
-        archive_handler.setFormatter(formatter)
-        root_logger.addHandler(archive_handler)
+        file_handler.setLevel(self.log_level)
+        file_handler.setFormatter(formatter)
+        root_logger.addHandler(file_handler)
 
         # Console handler (optional)
         if self.console_output:
@@ -106,12 +199,26 @@ class SpeechBridgeLogger:
             console_handler.setFormatter(formatter)
             root_logger.addHandler(console_handler)
 
-        # Log session start in archive
+        # Log session start (once per archive per process unless forced;
+        # the freshly truncated current log always gets it)
         separator = "=" * 80
-        root_logger.info(separator)
-        root_logger.info(f"SpeechBridge session started at {datetime.now()}")
-        root_logger.info(f"Log directory: {self.log_dir.absolute()}")
-        root_logger.info(separator)
+        header = [
+            separator,
+            f"SpeechBridge session started at {datetime.now()}",
+            f"Log directory: {self.log_dir.absolute()}",
+            separator
+        ]
+
+        archive_key = str(self.archive_log.resolve())
+        if archive_key not in _SESSION_ARCHIVES or self.force_session_marker:
+            for line in header:
+                root_logger.info(line)
+            _SESSION_ARCHIVES.add(archive_key)
+        elif root_logger.isEnabledFor(logging.INFO):
+            for line in header:
+                file_handler.emit_current(root_logger.makeRecord(
+                    root_logger.name, logging.INFO, __file__, 0, line, None, None
+                ))
 
     def get_logger(self, name: str = 'speechbridge') -> logging.Logger:
         """
@@ -126,7 +233,11 @@ class SpeechBridgeLogger:
         # Ensure logger is child of speechbridge namespace
         if not name.startswith('speechbridge'):
             name = f'speechbridge.{name}'
-        return logging.getLogger(name)
+
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = self._loggers.setdefault(name, logging.getLogger(name))
+        return logger
 
     def get_current_log_path(self) -> Path:
         """
@@ -153,30 +264,52 @@ class SpeechBridgeLogger:
         Returns:
             str: Log contents
         """
-        if self.current_log.exists():
+        try:
             return self.current_log.read_text(encoding='utf-8')
-        return ""
+        except FileNotFoundError:
+            return ""
 
     def read_archive_log(self, lines: Optional[int] = None) -> str:
         """
         Read archive log contents
 
         Args:
-            lines: Number of last lines to read (None = all)
+            lines: Number of last lines to read (None or 0 = all)
 
         Returns:
             str: Log contents
         """
-        if not self.archive_log.exists():
+        try:
+            if not lines:
+                return self.archive_log.read_text(encoding='utf-8')
+
+            # Read last N lines (only N lines are kept in memory)
+            with open(self.archive_log, 'r', encoding='utf-8', buffering=1 << 20) as f:
+                return ''.join(deque(f, maxlen=lines))
+        except FileNotFoundError:
             return ""
 
-        if lines is None:
-            return self.archive_log.read_text(encoding='utf-8')
+    def read_archive_errors(self, max_errors: int = 50) -> str:
+        """
+        Read the last error lines from archive log
 
-        # Read last N lines
-        with open(self.archive_log, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
-            return ''.join(all_lines[-lines:])
+        Args:
+            max_errors: Maximum number of error lines to return
+
+        Returns:
+            str: Error lines, newest last
+        """
+        try:
+            with open(self.archive_log, 'rb') as f:
+                # Map the file so the backward scan only pages in its tail
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    lines = _scan_error_lines(buf, max_errors)
+        except FileNotFoundError:
+            return ""
+        except ValueError:
+            return ""  # Empty file, nothing to map
+
+        return '\n'.join(line.decode('utf-8', errors='replace') for line in lines)
 
     def clear_archive(self) -> None:
         """
@@ -184,16 +317,21 @@ class SpeechBridgeLogger:
 
         Warning: This deletes all archived logs!
         """
-        if self.archive_log.exists():
+        try:
             self.archive_log.unlink()
-            logger = self.get_logger()
-            logger.info("Archive log cleared")
+        except FileNotFoundError:
+            return
+        _SESSION_ARCHIVES.discard(str(self.archive_log.resolve()))
+
+        logger = self.get_logger()
+        logger.info("Archive log cleared")
 
 
 def setup_logging(
     log_dir: str = "logs",
     log_level: int = logging.DEBUG,
-    console_output: bool = True
+    console_output: bool = True,
+    force_session_marker: bool = False
 ) -> SpeechBridgeLogger:
     """
     Quick setup for logging system
@@ -202,6 +340,7 @@ def setup_logging(
         log_dir: Directory for log files
         log_level: Logging level
         console_output: Enable console output
+        force_session_marker: Always write a new session header
 
     Returns:
         SpeechBridgeLogger: Configured logger instance
@@ -214,5 +353,6 @@ def setup_logging(
     return SpeechBridgeLogger(
         log_dir=log_dir,
         log_level=log_level,
-        console_output=console_output
+        console_output=console_output,
+        force_session_marker=force_session_marker
     )
@@ -32,6 +32,12 @@ app.config['OUTPUT_FOLDER'].mkdir(exist_ok=True)
 # Store translation jobs
 translation_jobs = {}
 
+# Jobs running at once; each gets an equal share of cores for its ffmpeg runs
+MAX_CONCURRENT_JOBS = max(1, int(os.getenv('MAX_CONCURRENT_JOBS', '2')))
+FFMPEG_THREADS = int(os.getenv('FFMPEG_THREADS', '0')) or max(2, (os.cpu_count() or 2) // MAX_CONCURRENT_JOBS)
+SYNC_WORKERS = max(1, (os.cpu_count() or 2) // MAX_CONCURRENT_JOBS)
+job_slots = threading.BoundedSemaphore(MAX_CONCURRENT_JOBS)
+
 ALLOWED_EXTENSIONS = {'mp4', 'mov', 'avi', 'mkv', 'webm', 'flv', 'wmv'}
 SUPPORTED_LANGUAGES = {
     'ar': 'Arabic',
@@ -86,6 +92,8 @@ def allowed_file(filename):
 
 def translate_video_background(job_id, input_path, output_path, config):
     """Background task for video translation"""
+    # Wait for a free slot (job stays 'queued' until then)
+    job_slots.acquire()
     try:
         translation_jobs[job_id]['status'] = 'processing'
         translation_jobs[job_id]['progress'] = 'Initializing translation pipeline...'
@@ -97,8 +105,9 @@ def translate_video_background(job_id, input_path, output_path, config):
                    .with_whisper(model=config.whisper_model, language='auto')
                    .with_deepl(api_key=deepl_api_key, target_lang=config.target_lang)
                    .with_edge_tts()
-                   .with_ffmpeg()
+                   .with_ffmpeg(threads=FFMPEG_THREADS)
                    .with_temp_dir('temp')
+                   .with_sync_workers(SYNC_WORKERS)
                    .keep_temporary_files(False))
 
         # Configure pipeline options
@@ -131,6 +140,9 @@ def translate_video_background(job_id, input_path, output_path, config):
         translation_jobs[job_id]['progress'] = f'Error: {str(e)}'
         translation_jobs[job_id]['error'] = str(e)
 
+    finally:
+        job_slots.release()
+
 
 @app.route('/')
 def index():
@@ -283,4 +295,6 @@ if __name__ == '__main__':
     print("\nAccess the application at: http://localhost:5000")
     print("="*60 + "\n")
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Debug mode (and its reloader) only when explicitly requested
+    debug = os.getenv('FLASK_DEBUG') == '1'
+    app.run(debug=debug, host='0.0.0.0', port=5000, threaded=True, use_reloader=False)